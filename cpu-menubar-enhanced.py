@@ -19,6 +19,11 @@ import os
 import sys
 import time
 import threading
+import queue
+import bisect
+import heapq
+import functools
+import importlib
 from typing import Optional, List, Dict
 from dataclasses import dataclass
 from enum import Enum
@@ -39,19 +44,60 @@ MODULES_DIR = os.path.join(SCRIPT_DIR, 'modules')
 if MODULES_DIR not in sys.path:
     sys.path.insert(0, MODULES_DIR)
 
-# Import custom modules
-try:
-    from process_scorer import ProcessScorer, ProcessInfo
-    from thermal_monitor import ThermalMonitor, ThermalState, ThrottleState
-    from memory_monitor import MemoryMonitor, MemoryPressure, SwapState
-    from disk_cleaner import DiskCleaner, CleanupCategory
-except ImportError as e:
-    print(f"Warning: Could not import modules: {e}")
-    print("Some features may be unavailable")
-    ProcessScorer = None
-    ThermalMonitor = None
-    MemoryMonitor = None
-    DiskCleaner = None
+BYTES_PER_GB = 1 << 30
+GB_PER_BYTE = 1.0 / BYTES_PER_GB  # Multiply instead of dividing on every sample
+
+
+# Custom modules are imported on first use to keep app startup fast
+@functools.lru_cache(maxsize=None)
+def _load_module(name: str):
+    """Import a monitor module, or None if it is unavailable"""
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        print(f"Warning: Could not import {name}: {e}")
+        print("Some features may be unavailable")
+        return None
+
+
+MONITOR_RETRY_SECONDS = 60  # Re-probe a monitor whose availability probe failed
+_monitors: Dict[str, object] = {}
+_monitor_failed_at: Dict[str, float] = {}
+_monitor_lock = threading.Lock()  # Collector and UI threads may both ask first
+
+
+def _get_monitor(module_name: str, class_name: str, probe: Optional[str] = None):
+    """
+    Create the shared monitor instance on first use
+    If probe names a method, it is called on creation and a failure marks the
+    monitor unavailable until it is retried after MONITOR_RETRY_SECONDS
+    """
+    monitor = _monitors.get(class_name)
+    if monitor is not None:
+        return monitor
+
+    with _monitor_lock:
+        monitor = _monitors.get(class_name)
+        if monitor is not None:
+            return monitor
+        failed_at = _monitor_failed_at.get(class_name)
+        if failed_at is not None and time.monotonic() - failed_at < MONITOR_RETRY_SECONDS:
+            return None
+
+        module = _load_module(module_name)
+        if not module:
+            return None
+
+        monitor = getattr(module, class_name)()
+        if probe:
+            try:
+                getattr(monitor, probe)()
+            except Exception as e:
+                print(f"Warning: {class_name} unavailable: {e}")
+                _monitor_failed_at[class_name] = time.monotonic()
+                return None
+        _monitors[class_name] = monitor
+        return monitor
 
 
 class AutoCleanMode(Enum):
@@ -65,8 +111,15 @@ class AutoCleanMode(Enum):
 @dataclass
 class SystemStatus:
     """Combined system status"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10+): one of these is built per sample
+    __slots__ = (
+        'cpu_percent', 'memory_percent', 'memory_used_gb', 'memory_pressure',
+        'thermal_state', 'throttle_state', 'swap_used_gb', 'disk_free_gb', 'cleanable_gb',
+    )
+
     cpu_percent: float
     memory_percent: float
+    memory_used_gb: float
     memory_pressure: str
     thermal_state: str
     throttle_state: str
@@ -91,43 +144,116 @@ class EnhancedCPUMonitorApp(rumps.App):
     # Thresholds for auto-cleanup
     THRESHOLDS = {
         AutoCleanMode.CONSERVATIVE: {
-            'cpu': 90, 'memory': 95, 'thermal': ThermalState.CRITICAL
+            'cpu': 90, 'memory': 95, 'thermal': 'critical'
         },
         AutoCleanMode.BALANCED: {
-            'cpu': 70, 'memory': 85, 'thermal': ThermalState.HOT
+            'cpu': 70, 'memory': 85, 'thermal': 'hot'
         },
         AutoCleanMode.AGGRESSIVE: {
-            'cpu': 50, 'memory': 70, 'thermal': ThermalState.WARM
+            'cpu': 50, 'memory': 70, 'thermal': 'warm'
         },
     }
 
+    # Status indicators: CPU above 50% is yellow, above 80% red
+    CPU_THRESHOLDS = (50, 80)
+    CPU_EMOJIS = ("🟢", "🟡", "🔴")
+    PRESSURE_EMOJIS = {"critical": "🔴", "warn": "🟡"}
+
+    # Fixed label prefix per status menu item; only the value tail changes per tick
+    ITEM_LABELS = {
+        'cpu': "CPU: ",
+        'mem': "Memory: ",
+        'thermal': "Thermal: ",
+        'disk': "Disk Free: ",
+    }
+
+    # Menu bar title templates
+    TITLE_SIMPLE = "{cpu_emoji} {cpu:.0f}%"
+    TITLE_DETAILED = "{cpu_emoji}{cpu:.0f}% {mem_emoji}{mem:.0f}%"
+
+    # Reuse a killable-process scan between preview and cleanup actions
+    KILLABLE_CACHE_SECONDS = 5
+
+    # Metrics sampling interval (seconds): backs off while the system is idle
+    UPDATE_INTERVAL = 2
+    MAX_UPDATE_INTERVAL = 10
+    INTERVAL_BACKOFF = 1.5
+    STABLE_DELTA_PERCENT = 3
+
+    # Free disk space and swap change slowly; refresh them less often than the tick
+    DISK_POLL_SECONDS = 30
+    SWAP_POLL_SECONDS = 10
+    PRESSURE_POLL_SECONDS = 6
+
+    # Keep sampling at the base interval while hot so adaptive thermal reads keep up
+    HOT_THERMAL_STATES = frozenset({"hot", "critical", "danger"})
+
     def __init__(self):
         super(EnhancedCPUMonitorApp, self).__init__("CPU", quit_button=None)
         self.icon = None
 
-        # Initialize monitors
-        self.process_scorer = ProcessScorer() if ProcessScorer else None
-        self.thermal_monitor = ThermalMonitor() if ThermalMonitor else None
-        self.memory_monitor = MemoryMonitor() if MemoryMonitor else None
-        self.disk_cleaner = DiskCleaner() if DiskCleaner else None
-
         # State
         self.auto_clean_mode = AutoCleanMode.OFF
+        self._active_thresholds: Optional[Dict] = None  # Resolved in set_auto_mode
+        self._last_cleanup_inputs = None
         self.last_clean_time = 0
         self.cooldown_seconds = 180  # 3 minute cooldown
         self.show_detailed = False
         self.last_status: Optional[SystemStatus] = None
+        self._status_lock = threading.Lock()
+        self._collect_failed = False
+        self._collect_interval = self.UPDATE_INTERVAL
+        self._rendered_status: Optional[SystemStatus] = None
+        self._item_tails: Dict[str, str] = {}  # Last value tail written per menu item
+        self._last_title = ""
+        self._thermal_status = None  # Latest ThermalStatus read by the collector
+        self._rendered_thermal = None
+        self._disk_cache = (0.0, None)  # (timestamp, disk usage dict)
+        self._swap_cache = (0.0, 0.0)   # (timestamp, swap used GB)
+        self._pressure_cache = (0.0, "unknown")  # (timestamp, pressure level)
+        self._killable_cache: Dict[tuple, tuple] = {}  # (min_score, min_cpu) -> (timestamp, procs)
+
+        # Seed psutil's CPU counters so later non-blocking reads return a
+        # delta since the previous tick (this first call always returns 0.0)
+        psutil.cpu_percent(interval=None)
 
         # Build menu
         self._build_menu()
 
-        # Start update timer (2 second interval)
-        self.timer = rumps.Timer(self.update_status, 2)
+        # Collect metrics on a background thread so psutil calls never block the UI
+        self._collector = threading.Thread(target=self._collect_loop, daemon=True)
+        self._collector.start()
+
+        # Cleanups run one at a time on a single long-lived worker thread
+        self._cleanup_queue: queue.Queue = queue.Queue()
+        self._pending_cleanups = set()
+        self._pending_lock = threading.Lock()
+        self._cleanup_worker = threading.Thread(target=self._cleanup_worker_loop, daemon=True)
+        self._cleanup_worker.start()
+
+        # Render timer only reads the latest snapshot (no syscalls on the UI thread)
+        self.timer = rumps.Timer(self.update_status, self.UPDATE_INTERVAL)
         self.timer.start()
 
-        # Start thermal monitoring in background (less frequent)
-        self.thermal_timer = rumps.Timer(self.update_thermal, 10)
-        self.thermal_timer.start()
+    @property
+    def process_scorer(self):
+        """Process scorer (imported on first use)"""
+        return _get_monitor('process_scorer', 'ProcessScorer')
+
+    @property
+    def thermal_monitor(self):
+        """Thermal monitor (imported on first use)"""
+        return _get_monitor('thermal_monitor', 'ThermalMonitor')
+
+    @property
+    def memory_monitor(self):
+        """Memory monitor (imported on first use)"""
+        return _get_monitor('memory_monitor', 'MemoryMonitor', probe='get_pressure')
+
+    @property
+    def disk_cleaner(self):
+        """Disk cleaner (imported on first use)"""
+        return _get_monitor('disk_cleaner', 'DiskCleaner', probe='get_disk_usage')
 
     def _build_menu(self):
         """Build the menu structure"""
@@ -163,6 +289,12 @@ class EnhancedCPUMonitorApp(rumps.App):
         automode_menu.add(self.mode_conservative)
         automode_menu.add(self.mode_balanced)
         automode_menu.add(self.mode_aggressive)
+        self._mode_items = {
+            AutoCleanMode.OFF: self.mode_off,
+            AutoCleanMode.CONSERVATIVE: self.mode_conservative,
+            AutoCleanMode.BALANCED: self.mode_balanced,
+            AutoCleanMode.AGGRESSIVE: self.mode_aggressive,
+        }
         # Mark current mode
         self.mode_off.state = 1  # Default is OFF
 
@@ -183,119 +315,217 @@ class EnhancedCPUMonitorApp(rumps.App):
             rumps.MenuItem("Quit", callback=rumps.quit_application),
         ]
 
-    def update_status(self, _):
-        """Update CPU and memory stats"""
-        try:
-            # CPU
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-
-            # Memory
-            mem = psutil.virtual_memory()
-            memory_percent = mem.percent
-
-            # Memory pressure (if available)
-            memory_pressure = "unknown"
-            if self.memory_monitor:
-                try:
-                    mem_stats = self.memory_monitor.get_stats()
-                    memory_pressure = mem_stats.pressure.value
-                except:
-                    pass
-
-            # Disk
-            disk_free_gb = 0
-            cleanable_gb = 0
-            if self.disk_cleaner:
-                try:
-                    disk_usage = self.disk_cleaner.get_disk_usage()
-                    disk_free_gb = disk_usage['free'] / (1024**3)
-                except:
-                    pass
-
-            # Color code the CPU percentage
-            if cpu_percent > 80:
-                cpu_emoji = "🔴"
-            elif cpu_percent > 50:
-                cpu_emoji = "🟡"
-            else:
-                cpu_emoji = "🟢"
-
-            # Memory pressure indicator
-            if memory_pressure == "critical":
-                mem_emoji = "🔴"
-            elif memory_pressure == "warn":
-                mem_emoji = "🟡"
-            else:
-                mem_emoji = "🟢"
-
-            # Update menu bar title
-            if self.show_detailed:
-                self.title = f"{cpu_emoji}{cpu_percent:.0f}% {mem_emoji}{memory_percent:.0f}%"
-            else:
-                self.title = f"{cpu_emoji} {cpu_percent:.0f}%"
-
-            # Update menu items using stored references
-            self.cpu_item.title = f"CPU: {cpu_percent:.1f}% {cpu_emoji}"
-            self.mem_item.title = f"Memory: {memory_percent:.1f}% ({mem.used / (1024**3):.1f}GB) {mem_emoji}"
-            self.disk_item.title = f"Disk Free: {disk_free_gb:.1f}GB"
-
-            # Store status
-            self.last_status = SystemStatus(
-                cpu_percent=cpu_percent,
-                memory_percent=memory_percent,
-                memory_pressure=memory_pressure,
-                thermal_state="unknown",
-                throttle_state="unknown",
-                swap_used_gb=psutil.swap_memory().used / (1024**3),
-                disk_free_gb=disk_free_gb,
-                cleanable_gb=cleanable_gb
-            )
-
-            # Check auto-cleanup triggers
-            self._check_auto_cleanup(cpu_percent, memory_percent, memory_pressure)
+    def _collect_loop(self):
+        """Background worker: sample system metrics off the UI thread"""
+        while True:
+            time.sleep(self._collect_interval)
+            try:
+                status = self._collect_status()
+                self._collect_interval = self._next_interval(self.last_status, status)
+                with self._status_lock:
+                    self.last_status = status
+                    self._collect_failed = False
+            except Exception as e:
+                with self._status_lock:
+                    self._collect_failed = True
+                print(f"Update error: {e}")
+
+    def _next_interval(self, previous: Optional[SystemStatus], current: SystemStatus) -> float:
+        """Back off sampling while CPU/memory are stable, reset on any jump"""
+        if (previous is not None
+                and abs(current.cpu_percent - previous.cpu_percent) <= self.STABLE_DELTA_PERCENT
+                and abs(current.memory_percent - previous.memory_percent) <= self.STABLE_DELTA_PERCENT
+                and current.memory_pressure != "critical"
+                and current.thermal_state not in self.HOT_THERMAL_STATES):
+            return min(self._collect_interval * self.INTERVAL_BACKOFF, self.MAX_UPDATE_INTERVAL)
+        return self.UPDATE_INTERVAL
+
+    def _collect_status(self) -> SystemStatus:
+        """Gather CPU, memory and disk stats into a single snapshot"""
+        # CPU (non-blocking: delta since the previous sample)
+        cpu_percent = psutil.cpu_percent(interval=None)
+
+        # Memory
+        vm = psutil.virtual_memory()
+        memory_percent = vm.percent
+        memory_used_gb = vm.used * GB_PER_BYTE
+
+        # Memory pressure (monitor is None while its availability probe is failing)
+        memory_pressure = "unknown"
+        if self.memory_monitor:
+            try:
+                memory_pressure = self._get_cached_pressure()
+            except Exception as e:
+                print(f"Memory pressure error: {e}")
+
+        # Thermal (re-read at a cadence set by the last reading's state)
+        thermal_state = throttle_state = "unknown"
+        if self.thermal_monitor:
+            try:
+                thermal = self.thermal_monitor.get_status_adaptive(include_sensors=False)
+                self._thermal_status = thermal
+                thermal_state = thermal.cpu_state.value
+                throttle_state = thermal.throttle_state.value
+            except Exception as e:
+                print(f"Thermal update error: {e}")
+
+        # Disk
+        disk_free_gb = 0
+        cleanable_gb = 0
+        if self.disk_cleaner:
+            try:
+                disk_free_gb = self._get_cached_disk_usage()['free'] * GB_PER_BYTE
+            except Exception as e:
+                print(f"Disk usage error: {e}")
+
+        return SystemStatus(
+            cpu_percent=cpu_percent,
+            memory_percent=memory_percent,
+            memory_used_gb=memory_used_gb,
+            memory_pressure=memory_pressure,
+            thermal_state=thermal_state,
+            throttle_state=throttle_state,
+            swap_used_gb=self._get_cached_swap_used_gb(),
+            disk_free_gb=disk_free_gb,
+            cleanable_gb=cleanable_gb
+        )
 
-        except Exception as e:
-            self.title = "CPU: Error"
-            print(f"Update error: {e}")
+    def update_status(self, _):
+        """Render the latest collected snapshot (runs on the UI thread)"""
+        with self._status_lock:
+            status = self.last_status
+            failed = self._collect_failed
 
-    def update_thermal(self, _):
-        """Update thermal status (less frequent)"""
+        if failed:
+            self._set_title("CPU: Error")
+            return
+        if status is None or status is self._rendered_status:
+            return  # Nothing new since the last render
+        self._rendered_status = status
+
+        cpu_percent = status.cpu_percent
+        memory_percent = status.memory_percent
+        memory_pressure = status.memory_pressure
+
+        # Color code the CPU percentage and memory pressure
+        cpu_emoji = self.CPU_EMOJIS[bisect.bisect_left(self.CPU_THRESHOLDS, cpu_percent)]
+        mem_emoji = self.PRESSURE_EMOJIS.get(memory_pressure, "🟢")
+
+        # Update menu bar title
+        template = self.TITLE_DETAILED if self.show_detailed else self.TITLE_SIMPLE
+        self._set_title(template.format(
+            cpu_emoji=cpu_emoji, cpu=cpu_percent,
+            mem_emoji=mem_emoji, mem=memory_percent
+        ))
+
+        # Update menu items using stored references
+        self._set_item_title('cpu', self.cpu_item, f"{cpu_percent:.1f}% {cpu_emoji}")
+        self._set_item_title(
+            'mem', self.mem_item,
+            f"{memory_percent:.1f}% ({status.memory_used_gb:.1f}GB) {mem_emoji}"
+        )
+        self._set_item_title('disk', self.disk_item, f"{status.disk_free_gb:.1f}GB")
+        self.update_thermal()
+
+        # Check auto-cleanup triggers
+        self._check_auto_cleanup(cpu_percent, memory_percent, memory_pressure)
+
+    def _set_title(self, title: str):
+        """Set the menu bar title, skipping the NSStatusItem update when unchanged"""
+        if title != self._last_title:
+            self.title = title
+            self._last_title = title
+
+    def _set_item_title(self, key: str, item, tail: str):
+        """Set a menu item's value tail, skipping the Cocoa setTitle_ call when unchanged"""
+        if self._item_tails.get(key) != tail:
+            item.title = self.ITEM_LABELS[key] + tail
+            self._item_tails[key] = tail
+
+    def _get_cached_disk_usage(self) -> Dict:
+        """Get disk usage, refreshing at most every DISK_POLL_SECONDS"""
+        timestamp, usage = self._disk_cache
+        now = time.time()
+        if usage is None or now - timestamp > self.DISK_POLL_SECONDS:
+            usage = self.disk_cleaner.get_disk_usage()
+            self._disk_cache = (now, usage)
+        return usage
+
+    def _get_cached_pressure(self) -> str:
+        """Get the memory pressure level, refreshing at most every PRESSURE_POLL_SECONDS"""
+        timestamp, pressure = self._pressure_cache
+        now = time.time()
+        if now - timestamp > self.PRESSURE_POLL_SECONDS:
+            pressure = self.memory_monitor.get_pressure().value
+            self._pressure_cache = (now, pressure)
+        return pressure
+
+    def _get_cached_swap_used_gb(self) -> float:
+        """Get swap usage in GB, refreshing at most every SWAP_POLL_SECONDS"""
+        timestamp, swap_used_gb = self._swap_cache
+        now = time.time()
+        if now - timestamp > self.SWAP_POLL_SECONDS:
+            swap_used_gb = psutil.swap_memory().used * GB_PER_BYTE
+            self._swap_cache = (now, swap_used_gb)
+        return swap_used_gb
+
+    def update_thermal(self):
+        """Render the latest thermal reading taken by the collector thread"""
         if not self.thermal_monitor:
-            self.thermal_item.title = "Thermal: N/A"
+            self._set_item_title('thermal', self.thermal_item, "N/A")
             return
 
+        status = self._thermal_status
+        if status is None or status is self._rendered_thermal:
+            return  # No new reading since the last render
+        self._rendered_thermal = status
+
         try:
-            status = self.thermal_monitor.get_status(include_sensors=False)
+            from thermal_monitor import ThrottleState
 
             thermal_emoji = self.thermal_monitor.get_temperature_emoji(status.cpu_state)
             throttle_emoji = self.thermal_monitor.get_throttle_emoji(status.throttle_state)
 
             if status.cpu_temp > 0:
-                thermal_text = f"Thermal: {status.cpu_temp:.0f}°C {thermal_emoji}"
+                thermal_text = f"{status.cpu_temp:.0f}°C {thermal_emoji}"
                 if status.throttle_state != ThrottleState.NONE:
                     thermal_text += f" {throttle_emoji}"
             else:
-                thermal_text = f"Thermal: {status.cpu_state.value} {thermal_emoji}"
+                thermal_text = f"{status.cpu_state.value} {thermal_emoji}"
 
-            self.thermal_item.title = thermal_text
-
-            if self.last_status:
-                self.last_status.thermal_state = status.cpu_state.value
-                self.last_status.throttle_state = status.throttle_state.value
+            self._set_item_title('thermal', self.thermal_item, thermal_text)
 
         except Exception as e:
             print(f"Thermal update error: {e}")
 
+    def _cached_killable(self, min_score: float, min_cpu: float) -> List:
+        """Get killable processes, reusing a scan from the last few seconds"""
+        key = (min_score, min_cpu)
+        now = time.time()
+        cached = self._killable_cache.get(key)
+        if cached and now - cached[0] < self.KILLABLE_CACHE_SECONDS:
+            return cached[1]
+
+        killable = self.process_scorer.get_killable_processes(min_score=min_score, min_cpu=min_cpu)
+        self._killable_cache[key] = (now, killable)
+        return killable
+
     def _check_auto_cleanup(self, cpu: float, memory: float, pressure: str):
         """Check if auto-cleanup should trigger"""
-        if self.auto_clean_mode == AutoCleanMode.OFF:
+        thresholds = self._active_thresholds
+        if thresholds is None:
             return
 
         # Check cooldown
         if time.time() - self.last_clean_time < self.cooldown_seconds:
             return
 
-        thresholds = self.THRESHOLDS[self.auto_clean_mode]
+        # Same inputs as the last evaluation cannot change the outcome
+        inputs = (cpu, memory, pressure)
+        if inputs == self._last_cleanup_inputs:
+            return
+        self._last_cleanup_inputs = inputs
+
         should_clean = False
         reason = ""
 
@@ -320,8 +550,35 @@ class EnhancedCPUMonitorApp(rumps.App):
         if should_clean:
             self._run_auto_cleanup(reason)
 
+    def _enqueue_cleanup(self, func, *args) -> bool:
+        """
+        Queue a cleanup task for the worker thread
+        Returns False if the same task is already queued or running
+        """
+        with self._pending_lock:
+            if func in self._pending_cleanups:
+                return False
+            self._pending_cleanups.add(func)
+        self._cleanup_queue.put((func, args))
+        return True
+
+    def _cleanup_worker_loop(self):
+        """Run queued cleanup tasks one at a time"""
+        while True:
+            func, args = self._cleanup_queue.get()
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Cleanup task error: {e}")
+            finally:
+                with self._pending_lock:
+                    self._pending_cleanups.discard(func)
+
     def _run_auto_cleanup(self, reason: str):
         """Run automatic cleanup"""
+        if not self._enqueue_cleanup(self._background_cleanup, reason):
+            return  # A cleanup is already queued; keep the cooldown clock as is
+
         self.last_clean_time = time.time()
 
         rumps.notification(
@@ -330,11 +587,6 @@ class EnhancedCPUMonitorApp(rumps.App):
             f"Mode: {self.auto_clean_mode.value}"
         )
 
-        # Run in background thread
-        thread = threading.Thread(target=self._background_cleanup, args=(reason,))
-        thread.daemon = True
-        thread.start()
-
     def _background_cleanup(self, reason: str):
         """Background cleanup worker"""
         try:
@@ -342,7 +594,7 @@ class EnhancedCPUMonitorApp(rumps.App):
 
             if self.process_scorer:
                 # Get killable processes
-                killable = self.process_scorer.get_killable_processes(
+                killable = self._cached_killable(
                     min_score=30 if self.auto_clean_mode == AutoCleanMode.AGGRESSIVE else 50,
                     min_cpu=20 if self.auto_clean_mode == AutoCleanMode.AGGRESSIVE else 30
                 )
@@ -351,6 +603,7 @@ class EnhancedCPUMonitorApp(rumps.App):
                 for proc in killable[:5]:  # Limit to 5 processes
                     if self.process_scorer.kill_process_gracefully(proc.pid):
                         killed += 1
+                self._killable_cache.clear()
 
             # Notify result
             if killed > 0:
@@ -365,20 +618,27 @@ class EnhancedCPUMonitorApp(rumps.App):
 
     def run_process_cleanup(self, _):
         """Manual process cleanup"""
+        if not self._enqueue_cleanup(self._background_process_cleanup):
+            rumps.notification("Process Cleanup", "Already running", "Please wait for it to finish")
+            return
+
         rumps.notification("Process Cleanup", "Starting...", "Analyzing processes")
 
+    def _background_process_cleanup(self):
+        """Background process cleanup worker"""
         try:
             killed = 0
             protected = 0
 
             if self.process_scorer:
-                killable = self.process_scorer.get_killable_processes(min_score=30, min_cpu=20)
+                killable = self._cached_killable(min_score=30, min_cpu=20)
 
                 for proc in killable[:10]:
                     if self.process_scorer.kill_process_gracefully(proc.pid):
                         killed += 1
                     else:
                         protected += 1
+                self._killable_cache.clear()
 
             if killed > 0:
                 rumps.notification(
@@ -402,20 +662,16 @@ class EnhancedCPUMonitorApp(rumps.App):
             rumps.notification("Cache Cleanup", "Error", "Disk cleaner not available")
             return
 
-        rumps.notification("Cache Cleanup", "Starting...", "This may take a moment")
-
-        try:
-            # Run cleanup in background
-            thread = threading.Thread(target=self._background_cache_cleanup)
-            thread.daemon = True
-            thread.start()
+        if not self._enqueue_cleanup(self._background_cache_cleanup):
+            rumps.notification("Cache Cleanup", "Already running", "Please wait for it to finish")
+            return
 
-        except Exception as e:
-            rumps.notification("Cache Cleanup", "Error", str(e))
+        rumps.notification("Cache Cleanup", "Starting...", "This may take a moment")
 
     def _background_cache_cleanup(self):
         """Background cache cleanup worker"""
         try:
+            from disk_cleaner import CleanupCategory
             results = self.disk_cleaner.clean(
                 categories=[
                     CleanupCategory.USER_CACHE,
@@ -443,15 +699,11 @@ class EnhancedCPUMonitorApp(rumps.App):
 
     def run_deep_cleanup(self, _):
         """Run comprehensive cleanup"""
-        rumps.notification("Deep Clean", "Starting...", "Cleaning processes and caches")
-
-        try:
-            thread = threading.Thread(target=self._background_deep_cleanup)
-            thread.daemon = True
-            thread.start()
+        if not self._enqueue_cleanup(self._background_deep_cleanup):
+            rumps.notification("Deep Clean", "Already running", "Please wait for it to finish")
+            return
 
-        except Exception as e:
-            rumps.notification("Deep Clean", "Error", str(e))
+        rumps.notification("Deep Clean", "Starting...", "Cleaning processes and caches")
 
     def _background_deep_cleanup(self):
         """Background deep cleanup worker"""
@@ -460,10 +712,11 @@ class EnhancedCPUMonitorApp(rumps.App):
         # Process cleanup
         killed = 0
         if self.process_scorer:
-            killable = self.process_scorer.get_killable_processes(min_score=25, min_cpu=15)
+            killable = self._cached_killable(min_score=25, min_cpu=15)
             for proc in killable[:10]:
                 if self.process_scorer.kill_process_gracefully(proc.pid):
                     killed += 1
+            self._killable_cache.clear()
         results.append(f"Processes: {killed}")
 
         # Cache cleanup
@@ -488,22 +741,23 @@ class EnhancedCPUMonitorApp(rumps.App):
             rumps.alert("Preview", "Monitoring modules not available")
             return
 
-        msg = "🔍 CLEANUP PREVIEW (Dry Run)\n"
-        msg += "=" * 40 + "\n\n"
+        parts = ["🔍 CLEANUP PREVIEW (Dry Run)\n"]
+        parts.append("=" * 40 + "\n\n")
 
         # Process preview
         if self.process_scorer:
-            killable = self.process_scorer.get_killable_processes(min_score=30, min_cpu=20)
+            killable = self._cached_killable(min_score=30, min_cpu=20)
             if killable:
-                msg += "⚠️ KILLABLE PROCESSES:\n"
+                parts.append("⚠️ KILLABLE PROCESSES:\n")
                 for proc in killable[:5]:
-                    msg += f"   {proc.name}: {proc.cpu_percent:.1f}% CPU (score: {proc.kill_score:.0f})\n"
+                    parts.append(f"   {proc.name}: {proc.cpu_percent:.1f}% CPU (score: {proc.kill_score:.0f})\n")
             else:
-                msg += "✅ No killable processes\n"
-            msg += "\n"
+                parts.append("✅ No killable processes\n")
+            parts.append("\n")
 
         # Cache preview
         if self.disk_cleaner:
+            from disk_cleaner import CleanupCategory
             results = self.disk_cleaner.clean(
                 categories=[
                     CleanupCategory.USER_CACHE,
@@ -513,8 +767,8 @@ class EnhancedCPUMonitorApp(rumps.App):
                 dry_run=True
             )
             total = sum(r.bytes_freed for r in results if not r.skipped)
-            msg += f"🗑️ CLEANABLE CACHES:\n"
-            msg += f"   Total: {self.disk_cleaner.format_size(total)}\n"
+            parts.append(f"🗑️ CLEANABLE CACHES:\n")
+            parts.append(f"   Total: {self.disk_cleaner.format_size(total)}\n")
 
             # Show by category
             by_category = {}
@@ -524,33 +778,38 @@ class EnhancedCPUMonitorApp(rumps.App):
                     by_category[cat] = by_category.get(cat, 0) + r.bytes_freed
 
             for cat, size in sorted(by_category.items(), key=lambda x: x[1], reverse=True):
-                msg += f"   {cat}: {self.disk_cleaner.format_size(size)}\n"
+                parts.append(f"   {cat}: {self.disk_cleaner.format_size(size)}\n")
 
-        rumps.alert("Cleanup Preview", msg)
+        rumps.alert("Cleanup Preview", "".join(parts))
 
     def show_top_processes(self, _):
         """Show top CPU processes"""
         try:
             processes = []
-            for proc in psutil.process_iter(['name', 'cpu_percent', 'memory_percent']):
+            for proc in psutil.process_iter():
                 try:
-                    info = proc.info
-                    if info['cpu_percent'] > 1:
-                        processes.append(info)
-                except:
+                    # Batch the per-process reads into a single syscall pass
+                    with proc.oneshot():
+                        cpu_percent = proc.cpu_percent()
+                        if cpu_percent > 1:
+                            processes.append({
+                                'name': proc.name(),
+                                'cpu_percent': cpu_percent,
+                                'memory_percent': proc.memory_percent(),
+                            })
+                except psutil.Error:
                     pass
 
-            processes.sort(key=lambda x: x['cpu_percent'], reverse=True)
-            top = processes[:10]
+            top = heapq.nlargest(10, processes, key=lambda x: x['cpu_percent'])
 
-            msg = "🔝 TOP CPU PROCESSES\n"
-            msg += "=" * 40 + "\n\n"
+            parts = ["🔝 TOP CPU PROCESSES\n"]
+            parts.append("=" * 40 + "\n\n")
 
             for p in top:
                 name = p['name'][:25]
-                msg += f"{name:25s}  CPU: {p['cpu_percent']:5.1f}%  MEM: {p['memory_percent']:5.1f}%\n"
+                parts.append(f"{name:25s}  CPU: {p['cpu_percent']:5.1f}%  MEM: {p['memory_percent']:5.1f}%\n")
 
-            rumps.alert("Top Processes", msg)
+            rumps.alert("Top Processes", "".join(parts))
 
         except Exception as e:
             rumps.alert("Error", f"Could not get processes: {e}")
@@ -563,18 +822,19 @@ class EnhancedCPUMonitorApp(rumps.App):
 
         try:
             all_procs = self.process_scorer.get_all_processes(min_cpu=1)
-            protected = [p for p in all_procs if p.is_protected][:15]
+            all_protected = [p for p in all_procs if p.is_protected]
+            protected = all_protected[:15]
 
-            msg = "🛡️ PROTECTED PROCESSES\n"
-            msg += "(Will NOT be killed)\n"
-            msg += "=" * 40 + "\n\n"
+            parts = ["🛡️ PROTECTED PROCESSES\n"]
+            parts.append("(Will NOT be killed)\n")
+            parts.append("=" * 40 + "\n\n")
 
             for p in protected:
-                msg += f"{p.name[:25]:25s}  {p.category.value}\n"
+                parts.append(f"{p.name[:25]:25s}  {p.category.value}\n")
 
-            msg += f"\n Total protected: {len([p for p in all_procs if p.is_protected])}"
+            parts.append(f"\n Total protected: {len(all_protected)}")
 
-            rumps.alert("Protected Processes", msg)
+            rumps.alert("Protected Processes", "".join(parts))
 
         except Exception as e:
             rumps.alert("Error", str(e))
@@ -586,19 +846,19 @@ class EnhancedCPUMonitorApp(rumps.App):
             return
 
         try:
-            killable = self.process_scorer.get_killable_processes(min_score=20, min_cpu=10)
+            killable = self._cached_killable(min_score=20, min_cpu=10)
 
-            msg = "⚠️ KILLABLE PROCESSES\n"
-            msg += "(Can be safely terminated)\n"
-            msg += "=" * 40 + "\n\n"
+            parts = ["⚠️ KILLABLE PROCESSES\n"]
+            parts.append("(Can be safely terminated)\n")
+            parts.append("=" * 40 + "\n\n")
 
             if killable:
                 for p in killable[:10]:
-                    msg += f"{p.name[:20]:20s}  CPU:{p.cpu_percent:5.1f}%  Score:{p.kill_score:5.1f}\n"
+                    parts.append(f"{p.name[:20]:20s}  CPU:{p.cpu_percent:5.1f}%  Score:{p.kill_score:5.1f}\n")
             else:
-                msg += "No killable processes found\n"
+                parts.append("No killable processes found\n")
 
-            rumps.alert("Killable Processes", msg)
+            rumps.alert("Killable Processes", "".join(parts))
 
         except Exception as e:
             rumps.alert("Error", str(e))
@@ -612,29 +872,29 @@ class EnhancedCPUMonitorApp(rumps.App):
         try:
             status = self.thermal_monitor.get_status(include_sensors=True)
 
-            msg = "🌡️ THERMAL STATUS\n"
-            msg += "=" * 40 + "\n\n"
+            parts = ["🌡️ THERMAL STATUS\n"]
+            parts.append("=" * 40 + "\n\n")
 
-            msg += f"CPU Temperature: {status.cpu_temp:.1f}°C {self.thermal_monitor.get_temperature_emoji(status.cpu_state)}\n"
+            parts.append(f"CPU Temperature: {status.cpu_temp:.1f}°C {self.thermal_monitor.get_temperature_emoji(status.cpu_state)}\n")
             if status.gpu_temp:
-                msg += f"GPU Temperature: {status.gpu_temp:.1f}°C\n"
+                parts.append(f"GPU Temperature: {status.gpu_temp:.1f}°C\n")
             if status.battery_temp:
-                msg += f"Battery Temp:    {status.battery_temp:.1f}°C\n"
+                parts.append(f"Battery Temp:    {status.battery_temp:.1f}°C\n")
 
-            msg += f"\nThermal State:   {status.cpu_state.value}\n"
-            msg += f"Throttle State:  {status.throttle_state.value} {self.thermal_monitor.get_throttle_emoji(status.throttle_state)}\n"
+            parts.append(f"\nThermal State:   {status.cpu_state.value}\n")
+            parts.append(f"Throttle State:  {status.throttle_state.value} {self.thermal_monitor.get_throttle_emoji(status.throttle_state)}\n")
 
             if status.fan_speeds:
-                msg += f"\n🌀 Fan Speeds:\n"
+                parts.append(f"\n🌀 Fan Speeds:\n")
                 for fan, rpm in status.fan_speeds.items():
-                    msg += f"   {fan}: {rpm} RPM\n"
+                    parts.append(f"   {fan}: {rpm} RPM\n")
 
             if status.recommendations:
-                msg += f"\n💡 Recommendations:\n"
+                parts.append(f"\n💡 Recommendations:\n")
                 for rec in status.recommendations[:3]:
-                    msg += f"   {rec}\n"
+                    parts.append(f"   {rec}\n")
 
-            rumps.alert("Thermal Status", msg)
+            rumps.alert("Thermal Status", "".join(parts))
 
         except Exception as e:
             rumps.alert("Error", str(e))
@@ -648,26 +908,26 @@ class EnhancedCPUMonitorApp(rumps.App):
         try:
             stats = self.memory_monitor.get_stats()
 
-            msg = "💾 MEMORY STATUS\n"
-            msg += "=" * 40 + "\n\n"
+            parts = ["💾 MEMORY STATUS\n"]
+            parts.append("=" * 40 + "\n\n")
 
-            msg += f"Total:       {self.memory_monitor.format_bytes(stats.total)}\n"
-            msg += f"Used:        {self.memory_monitor.format_bytes(stats.used)} ({stats.percent_used:.1f}%)\n"
-            msg += f"Available:   {self.memory_monitor.format_bytes(stats.available)}\n"
-            msg += f"\n"
-            msg += f"App Memory:  {self.memory_monitor.format_bytes(stats.app_memory)}\n"
-            msg += f"Wired:       {self.memory_monitor.format_bytes(stats.wired)}\n"
-            msg += f"Compressed:  {self.memory_monitor.format_bytes(stats.compressed)}\n"
-            msg += f"\n"
-            msg += f"Pressure:    {stats.pressure.value} {self.memory_monitor.get_pressure_emoji(stats.pressure)}\n"
-            msg += f"Swap Used:   {self.memory_monitor.format_bytes(stats.swap_used)} {self.memory_monitor.get_swap_emoji(stats.swap_state)}\n"
+            parts.append(f"Total:       {self.memory_monitor.format_bytes(stats.total)}\n")
+            parts.append(f"Used:        {self.memory_monitor.format_bytes(stats.used)} ({stats.percent_used:.1f}%)\n")
+            parts.append(f"Available:   {self.memory_monitor.format_bytes(stats.available)}\n")
+            parts.append(f"\n")
+            parts.append(f"App Memory:  {self.memory_monitor.format_bytes(stats.app_memory)}\n")
+            parts.append(f"Wired:       {self.memory_monitor.format_bytes(stats.wired)}\n")
+            parts.append(f"Compressed:  {self.memory_monitor.format_bytes(stats.compressed)}\n")
+            parts.append(f"\n")
+            parts.append(f"Pressure:    {stats.pressure.value} {self.memory_monitor.get_pressure_emoji(stats.pressure)}\n")
+            parts.append(f"Swap Used:   {self.memory_monitor.format_bytes(stats.swap_used)} {self.memory_monitor.get_swap_emoji(stats.swap_state)}\n")
 
             # Top memory processes
-            msg += f"\n🔝 Top Memory Users:\n"
+            parts.append(f"\n🔝 Top Memory Users:\n")
             for proc in self.memory_monitor.get_top_memory_processes(5):
-                msg += f"   {proc.name[:18]:18s} {self.memory_monitor.format_bytes(proc.rss):>8s}\n"
+                parts.append(f"   {proc.name[:18]:18s} {self.memory_monitor.format_bytes(proc.rss):>8s}\n")
 
-            rumps.alert("Memory Details", msg)
+            rumps.alert("Memory Details", "".join(parts))
 
         except Exception as e:
             rumps.alert("Error", str(e))
@@ -682,24 +942,24 @@ class EnhancedCPUMonitorApp(rumps.App):
             usage = self.disk_cleaner.get_disk_usage()
             analysis = self.disk_cleaner.analyze()
 
-            msg = "💿 DISK ANALYSIS\n"
-            msg += "=" * 40 + "\n\n"
+            parts = ["💿 DISK ANALYSIS\n"]
+            parts.append("=" * 40 + "\n\n")
 
-            msg += f"Total:  {usage['total_formatted']}\n"
-            msg += f"Used:   {usage['used_formatted']} ({usage['percent_used']:.1f}%)\n"
-            msg += f"Free:   {usage['free_formatted']}\n"
-            msg += f"\n"
+            parts.append(f"Total:  {usage['total_formatted']}\n")
+            parts.append(f"Used:   {usage['used_formatted']} ({usage['percent_used']:.1f}%)\n")
+            parts.append(f"Free:   {usage['free_formatted']}\n")
+            parts.append(f"\n")
 
-            msg += "🗑️ CLEANABLE BY CATEGORY:\n"
+            parts.append("🗑️ CLEANABLE BY CATEGORY:\n")
             total_cleanable = 0
             for category, size in sorted(analysis.items(), key=lambda x: x[1], reverse=True):
                 if size > 0:
-                    msg += f"   {category.value:15s}: {self.disk_cleaner.format_size(size)}\n"
+                    parts.append(f"   {category.value:15s}: {self.disk_cleaner.format_size(size)}\n")
                     total_cleanable += size
 
-            msg += f"\n   {'TOTAL':15s}: {self.disk_cleaner.format_size(total_cleanable)}\n"
+            parts.append(f"\n   {'TOTAL':15s}: {self.disk_cleaner.format_size(total_cleanable)}\n")
 
-            rumps.alert("Disk Analysis", msg)
+            rumps.alert("Disk Analysis", "".join(parts))
 
         except Exception as e:
             rumps.alert("Error", str(e))
@@ -707,21 +967,12 @@ class EnhancedCPUMonitorApp(rumps.App):
     def set_auto_mode(self, mode: AutoCleanMode):
         """Set auto-cleanup mode"""
         self.auto_clean_mode = mode
+        self._active_thresholds = self.THRESHOLDS.get(mode)
+        self._last_cleanup_inputs = None
 
         # Update menu checkmarks using stored references
-        self.mode_off.state = False
-        self.mode_conservative.state = False
-        self.mode_balanced.state = False
-        self.mode_aggressive.state = False
-
-        if mode == AutoCleanMode.OFF:
-            self.mode_off.state = True
-        elif mode == AutoCleanMode.CONSERVATIVE:
-            self.mode_conservative.state = True
-        elif mode == AutoCleanMode.BALANCED:
-            self.mode_balanced.state = True
-        elif mode == AutoCleanMode.AGGRESSIVE:
-            self.mode_aggressive.state = True
+        for item_mode, item in self._mode_items.items():
+            item.state = item_mode is mode
 
         rumps.notification(
             "Auto-Clean Mode",
@@ -733,6 +984,7 @@ class EnhancedCPUMonitorApp(rumps.App):
     def toggle_detailed(self, _):
         """Toggle detailed view in menu bar"""
         self.show_detailed = not self.show_detailed
+        self._rendered_status = None  # Re-render the current snapshot in the new style
         rumps.notification(
             "Display Mode",
             "Detailed view" if self.show_detailed else "Simple view",
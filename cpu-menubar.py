@@ -9,6 +9,9 @@ import subprocess
 import os
 import sys
 import time
+import threading
+import statistics
+from collections import deque
 
 # Get script directory for relative paths
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -24,10 +27,31 @@ except ImportError:
     import psutil
 
 class CPUMonitorApp(rumps.App):
+    # Seconds between samples
+    UPDATE_INTERVAL = 2
+    # Recent CPU readings whose median drives the emoji and auto-clean
+    CPU_HISTORY_SIZE = 3
+    # Consecutive failed samples before the title shows an error
+    MAX_SAMPLE_ERRORS = 3
+
     def __init__(self):
         super(CPUMonitorApp, self).__init__("CPU", quit_button=None)
         self.icon = None
-        self.timer = rumps.Timer(self.update_cpu, 2)
+
+        # Latest (cpu_percent, smoothed_cpu, virtual_memory) sample,
+        # written by the sampler thread
+        self._sample = None
+        self._sample_failed = False
+        self._rendered_sample = None
+        self._sample_lock = threading.Lock()
+
+        # Prime psutil's CPU counters so the first non-blocking read has a baseline
+        psutil.cpu_percent(interval=None)
+        self._sampler = threading.Thread(target=self._sample_loop, daemon=True)
+        self._sampler.start()
+
+        # The UI timer only renders the latest sample
+        self.timer = rumps.Timer(self.update_cpu, self.UPDATE_INTERVAL)
         self.timer.start()
 
         # Store menu item references for reliable updates
@@ -51,29 +75,93 @@ class CPUMonitorApp(rumps.App):
         self.auto_clean = False
         self.last_clean_time = 0
 
+        # Last rendered text; assignments only happen when it changes
+        self._last_title = None
+        self._last_cpu_text = None
+        self._last_mem_text = None
+
+    def _sample_loop(self):
+        """
+        Background worker: sample CPU and memory on a fixed cadence
+        Sleeps until an absolute deadline so the period doesn't drift with
+        sampling time; resyncs instead of bursting if it falls behind
+        """
+        cpu_history = deque(maxlen=self.CPU_HISTORY_SIZE)
+        errors = 0
+        deadline = time.monotonic()
+        while True:
+            deadline += self.UPDATE_INTERVAL
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                deadline = time.monotonic()
+
+            try:
+                # Non-blocking: measures usage since the previous sample
+                cpu_percent = psutil.cpu_percent(interval=None)
+                mem = psutil.virtual_memory()
+            except Exception:
+                # Keep showing the last good sample through one-off failures
+                errors += 1
+                if errors >= self.MAX_SAMPLE_ERRORS:
+                    with self._sample_lock:
+                        self._sample_failed = True
+                continue
+
+            errors = 0
+            cpu_history.append(cpu_percent)
+            sample = (cpu_percent, statistics.median(cpu_history), mem)
+            with self._sample_lock:
+                self._sample = sample
+                self._sample_failed = False
+
     def update_cpu(self, _):
-        """Update CPU and memory stats"""
+        """Render the latest CPU and memory sample (runs on the UI thread)"""
+        with self._sample_lock:
+            sample = self._sample
+            failed = self._sample_failed
+
+        if failed:
+            if self._last_title != "CPU: Error":
+                self.title = "CPU: Error"
+                self._last_title = self.title
+            return
+        if sample is None or sample is self._rendered_sample:
+            return
+        self._rendered_sample = sample
+
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            mem = psutil.virtual_memory()
+            cpu_percent, smoothed_cpu, mem = sample
 
-            # Color code the CPU percentage
-            if cpu_percent > 80:
+            # Color code the CPU percentage (median, so one-off spikes don't flap)
+            if smoothed_cpu > 80:
                 emoji = "🔴"
-            elif cpu_percent > 50:
+            elif smoothed_cpu > 50:
                 emoji = "🟡"
             else:
                 emoji = "🟢"
 
-            # Update menu bar title
-            self.title = f"{emoji} {cpu_percent:.0f}%"
+            # Update menu bar title (each assignment redraws through Cocoa);
+            # shows the same median as the emoji, the menu item keeps the raw sample
+            title = f"{emoji} {smoothed_cpu:.0f}%"
+            if title != self._last_title:
+                self.title = title
+                self._last_title = title
 
             # Update menu items using stored references
-            self.cpu_item.title = f"CPU: {cpu_percent:.1f}%"
-            self.mem_item.title = f"Memory: {mem.percent:.1f}% ({mem.used / (1024**3):.1f}GB used)"
+            cpu_text = f"CPU: {cpu_percent:.1f}%"
+            if cpu_text != self._last_cpu_text:
+                self.cpu_item.title = cpu_text
+                self._last_cpu_text = cpu_text
+
+            mem_text = f"Memory: {mem.percent:.1f}% ({mem.used / (1024**3):.1f}GB used)"
+            if mem_text != self._last_mem_text:
+                self.mem_item.title = mem_text
+                self._last_mem_text = mem_text
 
             # Auto-clean if enabled and CPU is high
-            if self.auto_clean and cpu_percent > 70:
+            if self.auto_clean and smoothed_cpu > 70:
                 current_time = time.time()
                 if current_time - self.last_clean_time > 180:  # 3 min cooldown
                     self.run_cleanup(None)
@@ -81,6 +169,7 @@ class CPUMonitorApp(rumps.App):
 
         except Exception as e:
             self.title = "CPU: Error"
+            self._last_title = self.title
 
     def run_cleanup(self, _):
         """Run the CPU cleanup script"""
@@ -143,14 +232,24 @@ class CPUMonitorApp(rumps.App):
     def show_top(self, _):
         """Show top CPU processes in an alert"""
         try:
-            # Get top processes
+            # Prime per-process CPU counters; cpu_percent needs two samples
+            procs = list(psutil.process_iter())
+            for proc in procs:
+                try:
+                    proc.cpu_percent()
+                except psutil.Error:
+                    pass
+            time.sleep(0.1)
+
+            # Get top processes, batching each process's reads with oneshot()
             processes = []
-            for proc in psutil.process_iter(['name', 'cpu_percent']):
+            for proc in procs:
                 try:
-                    info = proc.info
-                    if info['cpu_percent'] > 1:  # Only show processes using >1% CPU
-                        processes.append((info['name'][:30], info['cpu_percent']))
-                except:
+                    with proc.oneshot():
+                        cpu = proc.cpu_percent()
+                        if cpu > 1:  # Only show processes using >1% CPU
+                            processes.append((proc.name()[:30], cpu))
+                except psutil.Error:
                     pass
 
             # Sort and get top 10
@@ -1,10 +1,17 @@
 # CPU Monitor Modules
 # Enhanced monitoring and cleanup system for macOS
 
-from .process_scorer import ProcessScorer, ProcessInfo
-from .thermal_monitor import ThermalMonitor
-from .disk_cleaner import DiskCleaner
-from .memory_monitor import MemoryMonitor
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# `import modules` doesn't pay for features the caller never uses
+_LAZY_ATTRS = {
+    'ProcessScorer': '.process_scorer',
+    'ProcessInfo': '.process_scorer',
+    'ThermalMonitor': '.thermal_monitor',
+    'DiskCleaner': '.disk_cleaner',
+    'MemoryMonitor': '.memory_monitor',
+}
 
 __all__ = [
     'ProcessScorer',
@@ -15,3 +22,16 @@ __all__ = [
 ]
 
 __version__ = '2.0.0'
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
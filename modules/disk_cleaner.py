@@ -6,11 +6,17 @@ Inspired by: Mole, mac-cleanup-py, MacCleaner patterns
 """
 
 import os
+import re
 import shutil
+import stat
 import subprocess
+import sys
+import threading
 import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple, Callable
+from typing import List, Dict, Optional, Tuple, Callable, Iterator
 from pathlib import Path
 from enum import Enum
 import logging
@@ -18,6 +24,18 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Unit multipliers for sizes reported by brew/docker (e.g. "1.5GB")
+_SIZE_MULTIPLIERS = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
+
+# Homebrew reports like "This operation has freed approximately 1.2GB of disk space."
+_BREW_FREED_RE = re.compile(r'freed approximately\s+([\d.]+)\s*([KMGT]?B)', re.IGNORECASE)
+
+# Docker reports like "Total reclaimed space: 1.5GB"
+_DOCKER_FREED_RE = re.compile(r'reclaimed space:\s*([\d.]+)\s*([KMGT]?B)', re.IGNORECASE)
+
 
 class CleanupCategory(Enum):
     """Categories of cleanable items"""
@@ -33,7 +51,7 @@ class CleanupCategory(Enum):
     IOS_DEVICE = "ios_device"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CleanupTarget:
     """Definition of a cleanup target"""
     path: str
@@ -42,10 +60,18 @@ class CleanupTarget:
     safe_to_delete: bool = True
     requires_sudo: bool = False
     min_age_days: int = 0  # Only delete files older than this
-    exclude_patterns: List[str] = field(default_factory=list)
+    exclude_patterns: Tuple[str, ...] = ()
+    _exclude_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Match all exclusions with one compiled search instead of a loop per file
+        if self.exclude_patterns:
+            object.__setattr__(self, '_exclude_re', re.compile('|'.join(
+                re.escape(p.replace('*', '')) for p in self.exclude_patterns
+            )))
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class CleanupResult:
     """Result of a cleanup operation"""
     target: str
@@ -69,23 +95,34 @@ class DiskCleaner:
     - Size reporting
     """
 
+    # Upper bound on threads used to walk independent targets concurrently
+    MAX_SCAN_WORKERS = 16
+    # Deletion is write-heavy, so run fewer targets at once
+    MAX_DELETE_WORKERS = 8
+    # Paths handed to a single /bin/rm invocation (keeps argv well under ARG_MAX)
+    RM_BATCH_SIZE = 256
+
+    # Binary size units; index i covers values in [1024**i, 1024**(i+1))
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
     def __init__(self, home_dir: Optional[str] = None):
         self.home_dir = Path(home_dir or os.path.expanduser("~"))
-        self.cleanup_targets = self._initialize_targets()
+        self.cleanup_targets = DiskCleaner._initialize_targets(str(self.home_dir))
         self._total_freed = 0
         self._total_files = 0
+        self._totals_lock = threading.Lock()
 
-    def _initialize_targets(self) -> List[CleanupTarget]:
-        """Initialize all cleanup targets"""
-        home = str(self.home_dir)
-
-        return [
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _initialize_targets(home: str) -> Tuple[CleanupTarget, ...]:
+        """Initialize all cleanup targets (built once per home directory)"""
+        return (
             # System caches
             CleanupTarget(
                 path=f"{home}/Library/Caches",
                 category=CleanupCategory.USER_CACHE,
                 description="User application caches",
-                exclude_patterns=["com.apple.*", "CloudKit", "com.spotify.*"]
+                exclude_patterns=("com.apple.*", "CloudKit", "com.spotify.*")
             ),
 
             # Browser caches
@@ -177,7 +214,7 @@ class DiskCleaner:
                 category=CleanupCategory.LOGS,
                 description="User application logs",
                 min_age_days=7,
-                exclude_patterns=["DiagnosticReports"]
+                exclude_patterns=("DiagnosticReports",)
             ),
             CleanupTarget(
                 path="/var/log",
@@ -305,102 +342,122 @@ class DiskCleaner:
                 category=CleanupCategory.USER_CACHE,
                 description="Discord cache"
             ),
-        ]
+        )
+
+    def _walk_files(self, path: str) -> Iterator[Tuple[str, os.stat_result]]:
+        """
+        Recursively yield (path, lstat) for regular files under a directory
+        Directories are recognised from the listing itself; every other
+        entry costs exactly one lstat, and S_ISREG excludes symlinks
+        """
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            yield from self._walk_files(entry.path)
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        if stat.S_ISREG(st.st_mode):
+                            yield entry.path, st
+                    except OSError:
+                        pass
+        except OSError:
+            pass
 
     def get_size(self, path: str) -> int:
         """Get total size of a path in bytes"""
-        total = 0
-        path_obj = Path(path)
-
-        if not path_obj.exists():
+        try:
+            st = os.stat(path)
+        except OSError:
             return 0
 
-        try:
-            if path_obj.is_file():
-                return path_obj.stat().st_size
-
-            for entry in path_obj.rglob('*'):
-                try:
-                    if entry.is_file() and not entry.is_symlink():
-                        total += entry.stat().st_size
-                except (OSError, PermissionError):
-                    pass
-        except (OSError, PermissionError):
-            pass
+        if stat.S_ISREG(st.st_mode):
+            return st.st_size
+        if not stat.S_ISDIR(st.st_mode):
+            return 0
 
-        return total
+        return sum(file_st.st_size for _, file_st in self._walk_files(path))
 
     def format_size(self, bytes_size: int) -> str:
         """Format bytes to human readable string"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024
-        return f"{bytes_size:.1f} PB"
-
-    def _should_delete(self, path: Path, min_age_days: int,
-                       exclude_patterns: List[str]) -> bool:
-        """Check if a file/folder should be deleted"""
-        # Check exclusion patterns
-        for pattern in exclude_patterns:
-            if pattern in str(path):
-                return False
+        # Each unit is 10 bits wide, so the bit length picks the unit directly
+        idx = min(len(self.SIZE_UNITS) - 1, max(0, (int(bytes_size).bit_length() - 1) // 10))
+        return f"{bytes_size / (1 << (idx * 10)):.1f} {self.SIZE_UNITS[idx]}"
 
+    def _should_delete(self, path: str, mtime: float, cutoff_mtime: Optional[float],
+                       exclude_re: Optional[re.Pattern]) -> bool:
+        """
+        Check if a file should be deleted given its path and modification time
+        cutoff_mtime: files modified at or after this are too new (None = no age check)
+        """
         # Check age
-        if min_age_days > 0:
-            try:
-                mtime = path.stat().st_mtime
-                age_days = (time.time() - mtime) / (24 * 3600)
-                if age_days < min_age_days:
-                    return False
-            except (OSError, PermissionError):
-                return False
+        if cutoff_mtime is not None and mtime >= cutoff_mtime:
+            return False
+
+        # Check exclusion patterns
+        if exclude_re is not None and exclude_re.search(path):
+            return False
 
         return True
 
     def _delete_path(self, path: Path, min_age_days: int = 0,
-                     exclude_patterns: List[str] = None) -> Tuple[int, int, List[str]]:
+                     exclude_re: Optional[re.Pattern] = None,
+                     dry_run: bool = False) -> Tuple[int, int, List[str]]:
         """
         Delete a path (file or directory)
+        With dry_run, applies the same filters but only counts what would go
         Returns: (bytes_freed, files_deleted, errors)
         """
-        exclude_patterns = exclude_patterns or []
         bytes_freed = 0
         files_deleted = 0
         errors = []
+        # Resolve the age filter to an absolute mtime once per target
+        cutoff_mtime = time.time() - min_age_days * 24 * 3600 if min_age_days > 0 else None
 
         if not path.exists():
             return 0, 0, []
 
         try:
             if path.is_file():
-                if self._should_delete(path, min_age_days, exclude_patterns):
-                    size = path.stat().st_size
-                    path.unlink()
-                    return size, 1, []
+                st = path.stat()
+                if self._should_delete(str(path), st.st_mtime, cutoff_mtime, exclude_re):
+                    if not dry_run:
+                        path.unlink()
+                    return st.st_size, 1, []
                 return 0, 0, []
 
-            # Directory: iterate and delete eligible items
-            for item in list(path.rglob('*')):
-                try:
-                    if item.is_file() and not item.is_symlink():
-                        if self._should_delete(item, min_age_days, exclude_patterns):
-                            size = item.stat().st_size
-                            item.unlink()
-                            bytes_freed += size
+            root = str(path)
+
+            # Nothing to filter: let rm remove the whole tree in C
+            if not dry_run and cutoff_mtime is None and exclude_re is None:
+                return self._remove_tree_contents(root)
+
+            # Directory: walk bottom-up so each folder is emptied before
+            # we try to remove it, all in a single traversal
+            for dirpath, _dirnames, filenames in os.walk(root, topdown=False):
+                for filename in filenames:
+                    file_path = os.path.join(dirpath, filename)
+                    try:
+                        st = os.lstat(file_path)
+                        if stat.S_ISLNK(st.st_mode):
+                            continue
+                        if self._should_delete(file_path, st.st_mtime, cutoff_mtime, exclude_re):
+                            if not dry_run:
+                                os.unlink(file_path)
+                            bytes_freed += st.st_size
                             files_deleted += 1
-                except PermissionError:
-                    errors.append(f"Permission denied: {item}")
-                except OSError as e:
-                    errors.append(f"Error deleting {item}: {e}")
-
-            # Clean up empty directories
-            for item in sorted(path.rglob('*'), key=lambda x: len(str(x)), reverse=True):
-                try:
-                    if item.is_dir() and not any(item.iterdir()):
-                        item.rmdir()
-                except (OSError, PermissionError):
-                    pass
+                    except PermissionError:
+                        errors.append(f"Permission denied: {file_path}")
+                    except OSError as e:
+                        errors.append(f"Error deleting {file_path}: {e}")
+
+                # Remove the folder if it is now empty (never the target itself)
+                if dirpath != root and not dry_run:
+                    try:
+                        os.rmdir(dirpath)
+                    except OSError:
+                        pass
 
         except PermissionError:
             errors.append(f"Permission denied: {path}")
@@ -409,24 +466,65 @@ class DiskCleaner:
 
         return bytes_freed, files_deleted, errors
 
+    def _remove_tree_contents(self, root: str) -> Tuple[int, int, List[str]]:
+        """
+        Remove everything inside a directory with /bin/rm -rf
+        The directory itself is kept. The result is the difference between
+        measurements taken before and after rm, so only what was actually
+        removed is counted (an already-emptied directory reports 0)
+        Returns: (bytes_freed, files_deleted, errors)
+        """
+        def measure() -> Tuple[int, int]:
+            total_bytes = total_files = 0
+            for _, st in self._walk_files(root):
+                total_bytes += st.st_size
+                total_files += 1
+            return total_bytes, total_files
+
+        bytes_before, files_before = measure()
+        errors = []
+
+        try:
+            with os.scandir(root) as entries:
+                children = [entry.path for entry in entries]
+        except OSError as e:
+            return 0, 0, [f"Error processing {root}: {e}"]
+
+        for i in range(0, len(children), self.RM_BATCH_SIZE):
+            try:
+                result = subprocess.run(
+                    ["/bin/rm", "-rf", "--"] + children[i:i + self.RM_BATCH_SIZE],
+                    capture_output=True,
+                    text=True,
+                    timeout=600
+                )
+                if result.returncode != 0:
+                    errors.append(f"Error deleting in {root}: {result.stderr.strip()}")
+            except (subprocess.TimeoutExpired, OSError) as e:
+                errors.append(f"Error deleting in {root}: {e}")
+
+        # Cheap after a successful rm: only the emptied root is listed
+        bytes_left, files_left = measure()
+        return max(0, bytes_before - bytes_left), max(0, files_before - files_left), errors
+
     def analyze(self, categories: Optional[List[CleanupCategory]] = None) -> Dict[CleanupCategory, int]:
         """
         Analyze disk usage by category
         Returns dict of category -> bytes
         """
         results = {}
-
-        for target in self.cleanup_targets:
-            if categories and target.category not in categories:
-                continue
-
-            if not target.safe_to_delete:
-                continue
-
-            size = self.get_size(target.path)
-            if target.category not in results:
-                results[target.category] = 0
-            results[target.category] += size
+        targets = [t for t in self.cleanup_targets
+                   if (not categories or t.category in categories)
+                   and t.safe_to_delete]
+        if not targets:
+            return results
+
+        # Directory walks are syscall-bound, so threads overlap well
+        with ThreadPoolExecutor(max_workers=min(self.MAX_SCAN_WORKERS, len(targets))) as executor:
+            futures = {executor.submit(self.get_size, t.path): t for t in targets}
+            for future in as_completed(futures):
+                category = futures[future].category
+                results[category] = results.get(category, 0) + future.result()
 
         return results
 
@@ -441,63 +539,96 @@ class DiskCleaner:
             categories: List of categories to clean (None = all safe)
             dry_run: If True, only report what would be deleted
             include_unsafe: If True, include targets marked as unsafe
-            progress_callback: Function(target_name, current, total) for progress updates
+            progress_callback: Function(target_name, completed, total), called as each target finishes
 
         Returns:
             List of CleanupResult objects
         """
-        results = []
         targets = [t for t in self.cleanup_targets
                    if (categories is None or t.category in categories)
                    and (include_unsafe or t.safe_to_delete)
                    and not t.requires_sudo]
 
         total = len(targets)
+        if not targets:
+            return []
+
+        # Some targets sit inside others (e.g. browser caches under
+        # ~/Library/Caches); each group runs serially, ancestor first, and
+        # only separate groups are processed concurrently
+        groups = self._group_nested_targets(targets)
+        max_workers = self.MAX_SCAN_WORKERS if dry_run else self.MAX_DELETE_WORKERS
+        results = [None] * total
+        done = 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+            futures = [executor.submit(self._clean_group, targets, group, dry_run)
+                       for group in groups]
+            for future in as_completed(futures):
+                for i, result in future.result():
+                    results[i] = result
+                    done += 1
+                    if progress_callback:
+                        progress_callback(targets[i].description, done, total)
 
-        for i, target in enumerate(targets):
-            if progress_callback:
-                progress_callback(target.description, i + 1, total)
-
-            path = Path(target.path)
-
-            if not path.exists():
-                results.append(CleanupResult(
-                    target=target.path,
-                    category=target.category,
-                    bytes_freed=0,
-                    files_deleted=0,
-                    skipped=True,
-                    dry_run=dry_run
-                ))
-                continue
-
-            if dry_run:
-                size = self.get_size(target.path)
-                results.append(CleanupResult(
-                    target=target.path,
-                    category=target.category,
-                    bytes_freed=size,
-                    files_deleted=0,
-                    dry_run=True
-                ))
+        return results
+
+    @staticmethod
+    def _group_nested_targets(targets: List[CleanupTarget]) -> List[List[int]]:
+        """
+        Group target indices by their outermost enclosing target
+        Each group is ordered so a target comes after every target containing it
+        """
+        # Shallowest paths first, so ancestors are seen before their descendants
+        order = sorted(range(len(targets)), key=lambda i: len(Path(targets[i].path).parts))
+        roots: Dict[str, List[int]] = {}
+        for i in order:
+            path = targets[i].path.rstrip(os.sep)
+            for root, group in roots.items():
+                if path == root or path.startswith(root + os.sep):
+                    group.append(i)
+                    break
             else:
-                bytes_freed, files_deleted, errors = self._delete_path(
-                    path,
-                    target.min_age_days,
-                    target.exclude_patterns
-                )
-                results.append(CleanupResult(
-                    target=target.path,
-                    category=target.category,
-                    bytes_freed=bytes_freed,
-                    files_deleted=files_deleted,
-                    errors=errors,
-                    dry_run=False
-                ))
+                roots[path] = [i]
+        return list(roots.values())
+
+    def _clean_group(self, targets: List[CleanupTarget], group: List[int],
+                     dry_run: bool) -> List[Tuple[int, CleanupResult]]:
+        """Clean a group of nested targets one after another (runs on a worker thread)"""
+        return [(i, self._clean_target(targets[i], dry_run)) for i in group]
+
+    def _clean_target(self, target: CleanupTarget, dry_run: bool) -> CleanupResult:
+        """Measure or clean a single target (runs on a worker thread)"""
+        path = Path(target.path)
+
+        if not path.exists():
+            return CleanupResult(
+                target=target.path,
+                category=target.category,
+                bytes_freed=0,
+                files_deleted=0,
+                skipped=True,
+                dry_run=dry_run
+            )
+
+        bytes_freed, files_deleted, errors = self._delete_path(
+            path,
+            target.min_age_days,
+            target._exclude_re,
+            dry_run=dry_run
+        )
+        if not dry_run:
+            with self._totals_lock:
                 self._total_freed += bytes_freed
                 self._total_files += files_deleted
 
-        return results
+        return CleanupResult(
+            target=target.path,
+            category=target.category,
+            bytes_freed=bytes_freed,
+            files_deleted=files_deleted,
+            errors=errors,
+            dry_run=dry_run
+        )
 
     def clean_dns_cache(self) -> bool:
         """Flush DNS cache"""
@@ -507,11 +638,13 @@ class DiskCleaner:
                 capture_output=True,
                 check=True
             )
-            subprocess.run(
-                ["sudo", "killall", "-HUP", "mDNSResponder"],
-                capture_output=True,
-                check=False  # May fail without sudo
-            )
+            # Restarting mDNSResponder needs root; skip rather than prompt for sudo
+            if os.geteuid() == 0:
+                subprocess.run(
+                    ["killall", "-HUP", "mDNSResponder"],
+                    capture_output=True,
+                    check=False
+                )
             return True
         except subprocess.CalledProcessError:
             return False
@@ -522,11 +655,6 @@ class DiskCleaner:
         Returns: (bytes_freed, output)
         """
         try:
-            # Get initial size
-            brew_cache = Path("/usr/local/Homebrew/Library/Homebrew/vendor")
-            initial_size = self.get_size(str(brew_cache))
-
-            # Run cleanup
             result = subprocess.run(
                 ["brew", "cleanup", "-s"],
                 capture_output=True,
@@ -534,11 +662,17 @@ class DiskCleaner:
                 timeout=120
             )
 
-            # Get final size
-            final_size = self.get_size(str(brew_cache))
-            freed = max(0, initial_size - final_size)
+            # Parse output for freed space rather than re-walking the cache
+            output = result.stdout + result.stderr
+            freed = 0
+
+            match = _BREW_FREED_RE.search(output)
+            if match:
+                value = float(match.group(1))
+                unit = match.group(2).upper()
+                freed = int(value * _SIZE_MULTIPLIERS.get(unit, 1))
 
-            return freed, result.stdout + result.stderr
+            return freed, output
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
             return 0, str(e)
 
@@ -559,14 +693,11 @@ class DiskCleaner:
             output = result.stdout + result.stderr
             freed = 0
 
-            # Docker reports like "Total reclaimed space: 1.5GB"
-            import re
-            match = re.search(r'reclaimed space:\s*([\d.]+)\s*([KMGT]?B)', output, re.IGNORECASE)
+            match = _DOCKER_FREED_RE.search(output)
             if match:
                 value = float(match.group(1))
                 unit = match.group(2).upper()
-                multipliers = {'B': 1, 'KB': 1024, 'MB': 1024**2, 'GB': 1024**3, 'TB': 1024**4}
-                freed = int(value * multipliers.get(unit, 1))
+                freed = int(value * _SIZE_MULTIPLIERS.get(unit, 1))
 
             return freed, output
         except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired) as e:
@@ -5,18 +5,176 @@ macOS-specific memory pressure monitoring and management
 Inspired by: stats, Activity Monitor patterns
 """
 
+import ctypes
+import heapq
+import itertools
+import os
 import subprocess
 import re
+import sys
 import psutil
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
 import logging
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
-logging.basicConfig(level=logging.INFO)
+# Library module: leave handler/level configuration to the application
 logger = logging.getLogger(__name__)
 
+# vm_stat header: "Mach Virtual Memory Statistics: (page size of 16384 bytes)"
+_PAGE_SIZE_RE = re.compile(r'(\d+) bytes')
+
+# memory_pressure summary (its last line): "System-wide memory free percentage: 55%"
+_FREE_PERCENT_RE = re.compile(r'free percentage:\s*(\d+(?:\.\d+)?)\s*%')
+
+# vm_stat line label -> stats key (each line is "Label:   <pages>.")
+_VM_STAT_KEYS = {
+    'Pages free': 'free',
+    'Pages active': 'active',
+    'Pages inactive': 'inactive',
+    'Pages speculative': 'speculative',
+    'Pages wired down': 'wired',
+    'Pages occupied by compressor': 'compressed',
+    'File-backed pages': 'cached',
+    'Pages purgeable': 'purgeable',
+    'Swapins': 'swapins',
+    'Swapouts': 'swapouts',
+    'Compressions': 'compressions',
+    'Decompressions': 'decompressions',
+}
+
+# Mach host statistics (macOS): the counters vm_stat prints, without a fork
+_HOST_VM_INFO64 = 4
+_KERN_SUCCESS = 0
+
+# kern.memorystatus_vm_pressure_level values
+_PRESSURE_LEVELS = {1: 'normal', 2: 'warn', 4: 'critical'}
+
+
+class _VMStatistics64(ctypes.Structure):
+    """vm_statistics64_data_t from <mach/vm_statistics.h>"""
+    _fields_ = [
+        ('free_count', ctypes.c_uint32),
+        ('active_count', ctypes.c_uint32),
+        ('inactive_count', ctypes.c_uint32),
+        ('wire_count', ctypes.c_uint32),
+        ('zero_fill_count', ctypes.c_uint64),
+        ('reactivations', ctypes.c_uint64),
+        ('pageins', ctypes.c_uint64),
+        ('pageouts', ctypes.c_uint64),
+        ('faults', ctypes.c_uint64),
+        ('cow_faults', ctypes.c_uint64),
+        ('lookups', ctypes.c_uint64),
+        ('hits', ctypes.c_uint64),
+        ('purges', ctypes.c_uint64),
+        ('purgeable_count', ctypes.c_uint32),
+        ('speculative_count', ctypes.c_uint32),
+        ('decompressions', ctypes.c_uint64),
+        ('compressions', ctypes.c_uint64),
+        ('swapins', ctypes.c_uint64),
+        ('swapouts', ctypes.c_uint64),
+        ('compressor_page_count', ctypes.c_uint32),
+        ('throttled_count', ctypes.c_uint32),
+        ('external_page_count', ctypes.c_uint32),
+        ('internal_page_count', ctypes.c_uint32),
+        ('total_uncompressed_pages_in_compressor', ctypes.c_uint64),
+    ]
+
+
+@lru_cache(maxsize=None)
+def _libsystem() -> Optional[ctypes.CDLL]:
+    """Load libSystem with the prototypes we call, or None off macOS"""
+    if sys.platform != 'darwin':
+        return None
+
+    try:
+        libsystem = ctypes.CDLL('/usr/lib/libSystem.dylib')
+        libsystem.mach_host_self.argtypes = []
+        libsystem.mach_host_self.restype = ctypes.c_uint32
+        libsystem.host_page_size.argtypes = [ctypes.c_uint32, ctypes.POINTER(ctypes.c_size_t)]
+        libsystem.host_page_size.restype = ctypes.c_int
+        libsystem.host_statistics64.argtypes = [
+            ctypes.c_uint32, ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)
+        ]
+        libsystem.host_statistics64.restype = ctypes.c_int
+        libsystem.sysctlbyname.argtypes = [
+            ctypes.c_char_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_size_t),
+            ctypes.c_void_p, ctypes.c_size_t
+        ]
+        libsystem.sysctlbyname.restype = ctypes.c_int
+        return libsystem
+    except (OSError, AttributeError) as e:
+        logger.warning("libSystem unavailable: %s", e)
+        return None
+
+
+@lru_cache(maxsize=None)
+def _mach_host() -> Optional[Tuple[ctypes.CDLL, int, int]]:
+    """
+    Resolve the host port and page size once
+    Returns: (libsystem, host_port, page_size), or None when unavailable
+    """
+    libsystem = _libsystem()
+    if libsystem is None:
+        return None
+
+    host = libsystem.mach_host_self()
+    page_size = ctypes.c_size_t()
+    if libsystem.host_page_size(host, ctypes.byref(page_size)) == _KERN_SUCCESS:
+        return libsystem, host, page_size.value
+    return libsystem, host, os.sysconf('SC_PAGE_SIZE')
+
+
+def _sysctl_int(name: bytes) -> Optional[int]:
+    """Read an integer sysctl by name, or None if it can't be read"""
+    libsystem = _libsystem()
+    if libsystem is None:
+        return None
+
+    value = ctypes.c_int()
+    size = ctypes.c_size_t(ctypes.sizeof(value))
+    if libsystem.sysctlbyname(name, ctypes.byref(value), ctypes.byref(size), None, 0) != 0:
+        return None
+    return value.value
+
+
+def _host_vm_statistics() -> Optional[Dict[str, int]]:
+    """
+    Read VM statistics with host_statistics64(HOST_VM_INFO64)
+    Returns the same keys (in bytes) as MemoryMonitor._run_vm_stat, or None
+    """
+    mach = _mach_host()
+    if mach is None:
+        return None
+
+    libsystem, host, page_size = mach
+    info = _VMStatistics64()
+    count = ctypes.c_uint32(ctypes.sizeof(info) // ctypes.sizeof(ctypes.c_int))
+    if libsystem.host_statistics64(host, _HOST_VM_INFO64, ctypes.byref(info),
+                                   ctypes.byref(count)) != _KERN_SUCCESS:
+        return None
+
+    pages = {
+        # vm_stat reports free pages excluding speculative ones
+        'free': max(0, info.free_count - info.speculative_count),
+        'active': info.active_count,
+        'inactive': info.inactive_count,
+        'speculative': info.speculative_count,
+        'wired': info.wire_count,
+        'compressed': info.compressor_page_count,
+        'cached': info.external_page_count,
+        'purgeable': info.purgeable_count,
+        'swapins': info.swapins,
+        'swapouts': info.swapouts,
+        'compressions': info.compressions,
+        'decompressions': info.decompressions,
+    }
+    return {key: value * page_size for key, value in pages.items()}
+
 
 class MemoryPressure(Enum):
     """macOS memory pressure levels"""
@@ -36,6 +194,14 @@ class SwapState(Enum):
 @dataclass
 class MemoryStats:
     """Detailed memory statistics"""
+    # No field defaults, so plain __slots__ works on 3.9 too; up to 60 live in history
+    __slots__ = (
+        'total', 'available', 'used', 'free', 'active', 'inactive', 'wired',
+        'compressed', 'swap_total', 'swap_used', 'swap_free', 'cached',
+        'app_memory', 'pressure', 'swap_state', 'percent_used',
+        'pressure_percent', 'timestamp',
+    )
+
     total: int              # Total physical RAM
     available: int          # Available memory
     used: int               # Used memory
@@ -59,6 +225,8 @@ class MemoryStats:
 @dataclass
 class ProcessMemory:
     """Memory info for a process"""
+    __slots__ = ('pid', 'name', 'rss', 'vms', 'percent', 'compressed', 'is_compressible')
+
     pid: int
     name: str
     rss: int                # Resident Set Size (actual RAM)
@@ -68,6 +236,13 @@ class ProcessMemory:
     is_compressible: bool   # Can be compressed
 
 
+@dataclass
+class _RSSHistory:
+    """Recent RSS readings for one process, used for leak detection"""
+    samples: deque = field(default_factory=lambda: deque(maxlen=10))
+    rising_steps: int = 0   # Trailing consecutive non-decreasing steps in samples
+
+
 class MemoryMonitor:
     """
     macOS Memory Monitoring System
@@ -88,11 +263,53 @@ class MemoryMonitor:
         MemoryPressure.CRITICAL: 90,
     }
 
+    # Status emojis
+    PRESSURE_EMOJIS = {
+        MemoryPressure.NORMAL: "🟢",
+        MemoryPressure.WARN: "🟡",
+        MemoryPressure.CRITICAL: "🔴",
+    }
+    SWAP_EMOJIS = {
+        SwapState.NONE: "✅",
+        SwapState.LIGHT: "💧",
+        SwapState.MODERATE: "💦",
+        SwapState.HEAVY: "🌊",
+    }
+
+    # Tool paths and a minimal environment: no PATH search, no env copy per fork
+    VM_STAT_PATH = '/usr/bin/vm_stat'
+    MEMORY_PRESSURE_PATH = '/usr/bin/memory_pressure'
+    PURGE_PATH = '/usr/sbin/purge'
+    TOOL_ENV = {'PATH': '/usr/bin:/usr/sbin:/bin:/sbin'}
+
+    # Pressure percentage assumed when only the level is known
+    PRESSURE_ESTIMATES = {
+        MemoryPressure.NORMAL: 30,
+        MemoryPressure.WARN: 70,
+        MemoryPressure.CRITICAL: 90,
+    }
+
+    # Units for format_bytes, one per power of 1024
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+    # Upper bound on processes with leak-detection history
+    MAX_TRACKED_PROCESSES = 10_000
+
+    # get_stats() results younger than this are reused (each call forks vm_stat)
+    STATS_CACHE_SECONDS = 0.5
+
     def __init__(self):
-        self._history: List[MemoryStats] = []
         self._max_history = 60
+        self._history = deque(maxlen=self._max_history)  # oldest samples drop off
         self._last_stats: Optional[MemoryStats] = None
-        self._process_memory_history: Dict[int, List[int]] = {}  # pid -> [rss values]
+        self._last_stats_time = 0.0  # time.monotonic() of _last_stats
+        self._vm_page_size: Optional[int] = None  # vm_stat's page size, fixed per boot
+        self._process_memory_history: Dict[int, _RSSHistory] = {}
+        self._total_memory = psutil.virtual_memory().total
+        # Shared process_iter pass: [(pid, name, rss, vms, percent)]
+        self._process_snapshot: Optional[List[Tuple[int, str, int, int, float]]] = None
+        self._process_snapshot_time = 0.0
+        self._leak_checked_snapshot = None  # snapshot last folded into leak history
 
     def _run_vm_stat(self) -> Dict[str, int]:
         """
@@ -103,62 +320,72 @@ class MemoryMonitor:
 
         try:
             result = subprocess.run(
-                ['vm_stat'],
+                [self.VM_STAT_PATH],
                 capture_output=True,
                 text=True,
+                env=self.TOOL_ENV,
                 timeout=5
             )
 
             if result.returncode == 0:
-                # Parse page size
-                page_size = 4096  # Default macOS page size
-                for line in result.stdout.split('\n'):
-                    if 'page size of' in line:
-                        match = re.search(r'(\d+) bytes', line)
-                        if match:
-                            page_size = int(match.group(1))
-                        break
-
-                # Parse memory categories
-                patterns = {
-                    'free': r'Pages free:\s+(\d+)',
-                    'active': r'Pages active:\s+(\d+)',
-                    'inactive': r'Pages inactive:\s+(\d+)',
-                    'speculative': r'Pages speculative:\s+(\d+)',
-                    'wired': r'Pages wired down:\s+(\d+)',
-                    'compressed': r'Pages occupied by compressor:\s+(\d+)',
-                    'cached': r'File-backed pages:\s+(\d+)',
-                    'purgeable': r'Pages purgeable:\s+(\d+)',
-                    'swapins': r'Swapins:\s+(\d+)',
-                    'swapouts': r'Swapouts:\s+(\d+)',
-                    'compressions': r'Compressions:\s+(\d+)',
-                    'decompressions': r'Decompressions:\s+(\d+)',
-                }
-
-                for key, pattern in patterns.items():
-                    match = re.search(pattern, result.stdout)
-                    if match:
-                        # Convert pages to bytes
-                        stats[key] = int(match.group(1)) * page_size
+                # Page size is only ever on the header line; it can't change
+                # while we run, so parse it the first time only
+                header, _, body = result.stdout.partition('\n')
+                if self._vm_page_size is None:
+                    match = _PAGE_SIZE_RE.search(header)
+                    self._vm_page_size = int(match.group(1)) if match else 4096  # Default macOS page size
+                page_size = self._vm_page_size
+
+                # Single pass over the counters, converting pages to bytes
+                for line in body.splitlines():
+                    label, _, value = line.partition(':')
+                    key = _VM_STAT_KEYS.get(label)
+                    if key:
+                        try:
+                            stats[key] = int(value.strip().rstrip('.')) * page_size
+                        except ValueError:
+                            pass
 
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
-            logger.warning(f"Failed to get vm_stat: {e}")
+            logger.warning("Failed to get vm_stat: %s", e)
 
         return stats
 
     def _get_memory_pressure(self) -> Tuple[MemoryPressure, float]:
         """
         Get macOS memory pressure level
-        Uses the memory_pressure command for accurate pressure reading
+        Reads the kernel's pressure sysctls directly, falling back to the
+        memory_pressure command
         """
+        pressure_info = self._read_pressure_sysctls()
+        if pressure_info is not None:
+            return pressure_info
+        return self._run_memory_pressure()
+
+    def _read_pressure_sysctls(self) -> Optional[Tuple[MemoryPressure, float]]:
+        """Read pressure level and percentage from kernel sysctls, or None"""
+        level = _sysctl_int(b'kern.memorystatus_vm_pressure_level')
+        if level not in _PRESSURE_LEVELS:
+            return None
+
+        pressure = MemoryPressure(_PRESSURE_LEVELS[level])
+        # kern.memorystatus_level is the free percentage memory_pressure reports
+        free_percent = _sysctl_int(b'kern.memorystatus_level')
+        if free_percent is not None:
+            return pressure, float(100 - free_percent)
+        return pressure, float(self.PRESSURE_ESTIMATES[pressure])
+
+    def _run_memory_pressure(self) -> Tuple[MemoryPressure, float]:
+        """Get memory pressure by parsing the memory_pressure command"""
         pressure = MemoryPressure.NORMAL
         pressure_percent = 0.0
 
         try:
             result = subprocess.run(
-                ['memory_pressure'],
+                [self.MEMORY_PRESSURE_PATH],
                 capture_output=True,
                 text=True,
+                env=self.TOOL_ENV,
                 timeout=5
             )
 
@@ -173,21 +400,19 @@ class MemoryMonitor:
                 else:
                     pressure = MemoryPressure.NORMAL
 
-                # Try to get percentage
-                match = re.search(r'(\d+(?:\.\d+)?)\s*%', result.stdout)
+                # Try to get percentage from the summary line at the end
+                match = None
+                summary = output.rfind('free percentage')
+                if summary != -1:
+                    match = _FREE_PERCENT_RE.match(output, summary)
                 if match:
-                    pressure_percent = float(match.group(1))
+                    pressure_percent = 100 - float(match.group(1))
                 else:
                     # Estimate from level
-                    if pressure == MemoryPressure.CRITICAL:
-                        pressure_percent = 90
-                    elif pressure == MemoryPressure.WARN:
-                        pressure_percent = 70
-                    else:
-                        pressure_percent = 30
+                    pressure_percent = self.PRESSURE_ESTIMATES[pressure]
 
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
-            logger.warning(f"Failed to get memory pressure: {e}")
+            logger.warning("Failed to get memory pressure: %s", e)
             # Fall back to psutil-based estimation
             mem = psutil.virtual_memory()
             pressure_percent = mem.percent
@@ -210,17 +435,38 @@ class MemoryMonitor:
         else:
             return SwapState.HEAVY
 
-    def get_stats(self) -> MemoryStats:
-        """Get comprehensive memory statistics"""
+    def get_stats(self, force: bool = False) -> MemoryStats:
+        """
+        Get comprehensive memory statistics
+        Back-to-back callers share one sample for STATS_CACHE_SECONDS;
+        pass force=True to always take a fresh one
+        """
+        now = time.monotonic()
+        if (not force and self._last_stats is not None
+                and now - self._last_stats_time < self.STATS_CACHE_SECONDS):
+            return self._last_stats
+
         # Get basic stats from psutil
         mem = psutil.virtual_memory()
         swap = psutil.swap_memory()
 
-        # Get detailed macOS stats
-        vm_stats = self._run_vm_stat()
+        # Get detailed macOS stats and memory pressure straight from the kernel
+        vm_stats = _host_vm_statistics()
+        pressure_info = self._read_pressure_sysctls()
 
-        # Get memory pressure
-        pressure, pressure_percent = self._get_memory_pressure()
+        # Fall back to the command-line tools; when both are needed, run
+        # memory_pressure alongside vm_stat rather than after it
+        if vm_stats is None and pressure_info is None:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pressure_future = executor.submit(self._run_memory_pressure)
+                vm_stats = self._run_vm_stat()
+                pressure_info = pressure_future.result()
+        elif vm_stats is None:
+            vm_stats = self._run_vm_stat()
+        elif pressure_info is None:
+            pressure_info = self._run_memory_pressure()
+
+        pressure, pressure_percent = pressure_info
 
         # Calculate app memory (used - wired - compressed)
         wired = vm_stats.get('wired', 0)
@@ -251,36 +497,66 @@ class MemoryMonitor:
 
         # Update history
         self._last_stats = stats
+        self._last_stats_time = now
         self._history.append(stats)
-        if len(self._history) > self._max_history:
-            self._history.pop(0)
 
         return stats
 
+    def get_pressure(self) -> MemoryPressure:
+        """
+        Get only the memory pressure level
+        Cheaper than get_stats() when just the pressure indicator is needed
+        """
+        pressure, _ = self._get_memory_pressure()
+        return pressure
+
+    def _snapshot_processes(self) -> List[Tuple[int, str, int, int, float]]:
+        """
+        Walk all processes once and share the result between callers
+        Reused for STATS_CACHE_SECONDS like get_stats()
+        Returns: List of (pid, name, rss, vms, percent)
+        """
+        now = time.monotonic()
+        if (self._process_snapshot is not None
+                and now - self._process_snapshot_time < self.STATS_CACHE_SECONDS):
+            return self._process_snapshot
+
+        snapshot = []
+        total = self._total_memory
+        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
+            info = proc.info
+            mem_info = info['memory_info']
+            if mem_info is None:  # Access denied
+                continue
+            snapshot.append((
+                info['pid'],
+                info['name'] or "",
+                mem_info.rss,
+                mem_info.vms,
+                mem_info.rss * 100 / total
+            ))
+
+        self._process_snapshot = snapshot
+        self._process_snapshot_time = now
+        return snapshot
+
     def get_top_memory_processes(self, limit: int = 10) -> List[ProcessMemory]:
         """Get processes using the most memory"""
-        processes = []
-
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'memory_percent']):
-            try:
-                info = proc.info
-                mem_info = info['memory_info']
-
-                processes.append(ProcessMemory(
-                    pid=info['pid'],
-                    name=info['name'],
-                    rss=mem_info.rss,
-                    vms=mem_info.vms,
-                    percent=info['memory_percent'] or 0,
-                    compressed=0,  # Would need additional API access
-                    is_compressible=True
-                ))
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        # Sort by RSS and return top N
-        processes.sort(key=lambda x: x.rss, reverse=True)
-        return processes[:limit]
+        # Top N by RSS without sorting every process
+        top = heapq.nlargest(limit, self._snapshot_processes(), key=lambda p: p[2])
+
+        return [
+            ProcessMemory(
+                pid=pid,
+                name=name,
+                rss=rss,
+                vms=vms,
+                percent=percent,
+                compressed=0,  # Would need additional API access
+                is_compressible=True
+            )
+            for pid, name, rss, vms, percent in top
+        ]
 
     def detect_memory_leaks(self, threshold_mb: int = 100) -> List[Tuple[int, str, int]]:
         """
@@ -289,70 +565,63 @@ class MemoryMonitor:
         Returns: List of (pid, name, growth_mb) for processes with significant growth
         """
         leaks = []
-
-        for proc in psutil.process_iter(['pid', 'name', 'memory_info']):
-            try:
-                pid = proc.info['pid']
-                name = proc.info['name']
-                rss = proc.info['memory_info'].rss
-
-                if pid not in self._process_memory_history:
-                    self._process_memory_history[pid] = []
-
-                history = self._process_memory_history[pid]
-                history.append(rss)
-
-                # Keep only last 10 readings
-                if len(history) > 10:
-                    history.pop(0)
-
-                # Check for consistent growth
-                if len(history) >= 5:
-                    growth = history[-1] - history[0]
-                    growth_mb = growth / (1024 * 1024)
-
-                    # Check if growth is consistent (always increasing)
-                    is_growing = all(history[i] <= history[i+1] for i in range(len(history)-1))
-
-                    if is_growing and growth_mb > threshold_mb:
-                        leaks.append((pid, name, int(growth_mb)))
-
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                # Clean up history for dead processes
-                if pid in self._process_memory_history:
-                    del self._process_memory_history[pid]
+        snapshot = self._snapshot_processes()
+
+        # Only record each snapshot once, so cached reuse doesn't fake growth
+        record = snapshot is not self._leak_checked_snapshot
+        self._leak_checked_snapshot = snapshot
+
+        for pid, name, rss, _vms, _percent in snapshot:
+            history = self._process_memory_history.get(pid)
+            if history is None:
+                history = self._process_memory_history[pid] = _RSSHistory()
+            samples = history.samples
+
+            if record:
+                # Track the growth streak incrementally instead of rescanning
+                if samples:
+                    history.rising_steps = history.rising_steps + 1 if rss >= samples[-1] else 0
+                samples.append(rss)  # deque keeps only the last 10 readings
+                history.rising_steps = min(history.rising_steps, len(samples) - 1)
+
+            # Check for consistent growth (never decreased across the window)
+            if len(samples) >= 5 and history.rising_steps == len(samples) - 1:
+                growth_mb = (samples[-1] - samples[0]) / (1024 * 1024)
+                if growth_mb > threshold_mb:
+                    leaks.append((pid, name, int(growth_mb)))
+
+        if record:
+            # Drop history for processes that have exited
+            live = {p[0] for p in snapshot}
+            for pid in self._process_memory_history.keys() - live:
+                del self._process_memory_history[pid]
+
+            # Hard cap as a backstop; dicts iterate oldest-first
+            excess = len(self._process_memory_history) - self.MAX_TRACKED_PROCESSES
+            for pid in list(itertools.islice(self._process_memory_history, max(0, excess))):
+                del self._process_memory_history[pid]
 
         return sorted(leaks, key=lambda x: x[2], reverse=True)
 
     def format_bytes(self, bytes_size: int) -> str:
         """Format bytes to human readable string"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024
-        return f"{bytes_size:.1f} PB"
+        unit = min(len(self.SIZE_UNITS) - 1, max(0, (int(bytes_size).bit_length() - 1) // 10))
+        return f"{bytes_size / (1 << (10 * unit)):.1f} {self.SIZE_UNITS[unit]}"
 
     def get_pressure_emoji(self, pressure: MemoryPressure) -> str:
         """Get emoji for memory pressure level"""
-        emojis = {
-            MemoryPressure.NORMAL: "🟢",
-            MemoryPressure.WARN: "🟡",
-            MemoryPressure.CRITICAL: "🔴",
-        }
-        return emojis.get(pressure, "❓")
+        return self.PRESSURE_EMOJIS.get(pressure, "❓")
 
     def get_swap_emoji(self, state: SwapState) -> str:
         """Get emoji for swap state"""
-        emojis = {
-            SwapState.NONE: "✅",
-            SwapState.LIGHT: "💧",
-            SwapState.MODERATE: "💦",
-            SwapState.HEAVY: "🌊",
-        }
-        return emojis.get(state, "❓")
+        return self.SWAP_EMOJIS.get(state, "❓")
 
     def get_recommendations(self, stats: Optional[MemoryStats] = None) -> List[str]:
-        """Generate recommendations based on memory status"""
+        """
+        Generate recommendations based on memory status
+        Without explicit stats, reuses the cached get_stats() sample when it
+        is still fresh instead of sampling again
+        """
         if stats is None:
             stats = self.get_stats()
 
@@ -399,7 +668,7 @@ class MemoryMonitor:
         """
         try:
             result = subprocess.run(
-                ['sudo', 'purge'],
+                ['sudo', self.PURGE_PATH],
                 capture_output=True,
                 timeout=30
             )
@@ -412,8 +681,8 @@ class MemoryMonitor:
         if len(self._history) < 3:
             return "stable"
 
-        recent = [h.percent_used for h in self._history[-3:]]
-        avg_change = (recent[-1] - recent[0]) / len(recent)
+        # Deque indexing at either end is O(1)
+        avg_change = (self._history[-1].percent_used - self._history[-3].percent_used) / 3
 
         if avg_change > 3:
             return "rising_fast"
@@ -6,12 +6,33 @@ Inspired by: Mole, process-killer, port-killer patterns
 """
 
 import psutil
+import heapq
 import os
 import re
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from functools import cached_property
+from typing import Iterator, List, Dict, Optional, FrozenSet, Tuple
 from enum import Enum
 import logging
+import threading
+from collections import OrderedDict
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: google-re2 matches the category alternations in linear time
+# with no backtracking; fall back to the stdlib engine when unavailable
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
+# Patterns without any of these are matched by plain substring search
+_REGEX_METACHARS = frozenset('$^[](){}|\\?*+.')
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,7 +51,7 @@ class ProcessCategory(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProcessInfo:
     """Detailed process information with scoring"""
     pid: int
@@ -109,6 +130,9 @@ class ProcessScorer:
         ],
     }
 
+    # Categories that are always protected, whatever their resource use
+    _PROTECTED_CATEGORIES = frozenset(PROTECTED_PATTERNS)
+
     # Processes safe to kill when using high resources
     KILLABLE_PATTERNS = {
         ProcessCategory.BROWSER: [
@@ -163,72 +187,128 @@ class ProcessScorer:
         ProcessCategory.UNKNOWN: 0,
     }
 
+    # Bound on memoized (name, cmdline prefix) -> category entries
+    CATEGORY_CACHE_SIZE = 4096
+
+    # Per-process psutil reads are blocking syscalls, so overlap them
+    MAX_ANALYZE_WORKERS = 32
+
+    # Per-poll counters, fetched together in a single as_dict() pass
+    SAMPLE_ATTRS = ('create_time', 'memory_percent', 'num_threads', 'num_fds')
+
+    # Safety valve for the parent-chain walk
+    MAX_PARENT_DEPTH = 16
+
     def __init__(self, home_dir: Optional[str] = None):
         self.home_dir = home_dir or os.path.expanduser("~")
         self.current_pid = os.getpid()
-        self.parent_pids = self._get_parent_pids()
-        self._compiled_patterns: Dict[ProcessCategory, List[re.Pattern]] = {}
+        self._literal_patterns: Dict[ProcessCategory, Tuple[str, ...]] = {}
+        self._compiled_patterns: Dict[ProcessCategory, Optional[re.Pattern]] = {}
         self._compile_patterns()
+        self._category_cache: 'OrderedDict[Tuple[str, str], ProcessCategory]' = OrderedDict()
+        self._category_lock = threading.Lock()
+        # pid -> (create_time, name, cmdline, username)
+        self._static_cache: Dict[int, Tuple[float, str, str, str]] = {}
+        self._process_handles: Dict[int, psutil.Process] = {}
+        self._precompute_weights()
+
+    def _precompute_weights(self):
+        """Resolve scoring weights and weighted category terms once"""
+        weights = self.WEIGHTS
+        self._score_weights = (weights['cpu'], weights['memory'], weights['fds'], weights['age'])
+        self._category_terms = {
+            category: self.CATEGORY_PENALTIES.get(category, 0) * weights['category']
+            for category in ProcessCategory
+        }
 
     def _compile_patterns(self):
-        """Pre-compile regex patterns for performance"""
+        """Split each category into casefolded literals and one fused regex"""
+        # Matching runs against casefolded text, so the patterns are folded
+        # here once instead of paying for IGNORECASE on every search
         for category, patterns in {**self.PROTECTED_PATTERNS, **self.KILLABLE_PATTERNS}.items():
-            self._compiled_patterns[category] = [
-                re.compile(p, re.IGNORECASE) for p in patterns
-            ]
-
-    def _get_parent_pids(self) -> Set[int]:
+            folded = [p.casefold() for p in patterns]
+            literals = [p for p in folded if _REGEX_METACHARS.isdisjoint(p)]
+            regexes = [p for p in folded if not _REGEX_METACHARS.isdisjoint(p)]
+            self._literal_patterns[category] = tuple(literals)
+            self._compiled_patterns[category] = _regex_engine.compile(
+                "|".join(f"(?:{p})" for p in regexes)
+            ) if regexes else None
+
+    @cached_property
+    def parent_pids(self) -> FrozenSet[int]:
+        """Parent PIDs of current process, resolved once on first use"""
+        return self._get_parent_pids()
+
+    def _get_parent_pids(self) -> FrozenSet[int]:
         """Get all parent PIDs of current process"""
         parents = set()
         try:
             proc = psutil.Process(self.current_pid)
-            while proc:
+            depth = 0
+            while proc and depth < self.MAX_PARENT_DEPTH:
                 parents.add(proc.pid)
                 proc = proc.parent()
+                depth += 1
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
-        return parents
+        return frozenset(parents)
 
     def _categorize_process(self, name: str, cmdline: str) -> ProcessCategory:
+        """Determine process category, memoized for long-lived processes"""
+        key = (name, cmdline[:80])
+        cache = self._category_cache
+        with self._category_lock:
+            category = cache.get(key)
+            if category is not None:
+                cache.move_to_end(key)
+                return category
+
+        category = self._match_category(name, cmdline)
+        with self._category_lock:
+            cache[key] = category
+            if len(cache) > self.CATEGORY_CACHE_SIZE:
+                cache.popitem(last=False)
+        return category
+
+    def _match_category(self, name: str, cmdline: str) -> ProcessCategory:
         """Determine process category based on name and command line"""
-        search_text = f"{name} {cmdline}"
+        search_text = f"{name} {cmdline}".casefold()
 
         # Check protected patterns first
         for category in [ProcessCategory.SYSTEM_CRITICAL, ProcessCategory.DEVELOPMENT, ProcessCategory.TERMINAL]:
-            if category in self._compiled_patterns:
-                for pattern in self._compiled_patterns[category]:
-                    if pattern.search(search_text):
-                        return category
+            if self._matches_category(category, search_text):
+                return category
 
         # Check killable patterns
         for category in [ProcessCategory.BROWSER, ProcessCategory.COMMUNICATION,
                         ProcessCategory.CLOUD_SYNC, ProcessCategory.MEDIA, ProcessCategory.BACKGROUND]:
-            if category in self._compiled_patterns:
-                for pattern in self._compiled_patterns[category]:
-                    if pattern.search(search_text):
-                        return category
+            if self._matches_category(category, search_text):
+                return category
 
         return ProcessCategory.UNKNOWN
 
-    def _is_protected(self, pid: int, category: ProcessCategory, children_count: int,
-                      has_open_files: bool) -> bool:
-        """Determine if process should be protected from killing"""
+    def _matches_category(self, category: ProcessCategory, search_text: str) -> bool:
+        """Check literal substrings first, then the category's regex remainder"""
+        for literal in self._literal_patterns.get(category, ()):
+            if literal in search_text:
+                return True
+        pattern = self._compiled_patterns.get(category)
+        return pattern is not None and pattern.search(search_text) is not None
+
+    def _is_protected(self, pid: int, category: ProcessCategory, children_count: int) -> bool:
+        """Determine if process should be protected by the cheap predicates"""
         # Always protect current process tree
         if pid in self.parent_pids:
             return True
 
         # Protect system-critical and development processes
-        if category in [ProcessCategory.SYSTEM_CRITICAL, ProcessCategory.DEVELOPMENT, ProcessCategory.TERMINAL]:
+        if category in self._PROTECTED_CATEGORIES:
             return True
 
         # Protect processes with children (likely doing work)
         if children_count > 0:
             return True
 
-        # Protect processes with open files in home directory
-        if has_open_files:
-            return True
-
         return False
 
     def _check_open_files_in_home(self, proc: psutil.Process) -> bool:
@@ -266,57 +346,70 @@ class ProcessScorer:
         # Max age considered: 1 hour (3600 seconds)
         age_score = max(0, 50 - (age_seconds / 72))  # 0-50 range
 
-        # Category penalty/bonus
-        category_modifier = self.CATEGORY_PENALTIES.get(category, 0)
-
-        # Calculate weighted score
+        # Calculate weighted score; the category penalty/bonus is pre-weighted
+        cpu_weight, memory_weight, fds_weight, age_weight = self._score_weights
         score = (
-            cpu_score * self.WEIGHTS['cpu'] +
-            memory_score * self.WEIGHTS['memory'] +
-            fd_score * self.WEIGHTS['fds'] +
-            age_score * self.WEIGHTS['age'] +
-            category_modifier * self.WEIGHTS['category']
+            cpu_score * cpu_weight +
+            memory_score * memory_weight +
+            fd_score * fds_weight +
+            age_score * age_weight +
+            self._category_terms[category]
         )
 
         return round(score, 2)
 
-    def analyze_process(self, proc: psutil.Process) -> Optional[ProcessInfo]:
-        """Analyze a single process and return ProcessInfo"""
+    def analyze_process(self, proc: psutil.Process, cpu_percent: Optional[float] = None,
+                        now: Optional[float] = None) -> Optional[ProcessInfo]:
+        """Analyze a single process, reusing an already-sampled cpu_percent and poll time"""
         try:
             with proc.oneshot():
                 pid = proc.pid
-                name = proc.name()
-
-                try:
-                    cmdline = " ".join(proc.cmdline())
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    cmdline = ""
-
-                cpu_percent = proc.cpu_percent()
-                memory_percent = proc.memory_percent()
-                num_threads = proc.num_threads()
-
-                try:
-                    num_fds = proc.num_fds()
-                except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
-                    num_fds = 0
-
-                create_time = proc.create_time()
-                age_seconds = psutil.time.time() - create_time
+                sample = proc.as_dict(attrs=self.SAMPLE_ATTRS, ad_value=None)
+                create_time = sample['create_time']
+                if cpu_percent is None:
+                    cpu_percent = proc.cpu_percent()
+                memory_percent = sample['memory_percent']
+                num_threads = sample['num_threads']
+                num_fds = sample['num_fds'] or 0
+                if None in (create_time, memory_percent, num_threads):
+                    return None
+
+                # name/cmdline/username are fixed for a PID's lifetime; a
+                # changed create_time means the PID was reused
+                static = self._static_cache.get(pid)
+                if static is not None and static[0] == create_time:
+                    _, name, cmdline, username = static
+                else:
+                    name = proc.name()
+
+                    try:
+                        cmdline = " ".join(proc.cmdline())
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        cmdline = ""
+
+                    try:
+                        username = proc.username()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        username = ""
+
+                    self._static_cache[pid] = (create_time, name, cmdline, username)
+
+                if now is None:
+                    now = time.time()
+                age_seconds = now - create_time
 
                 try:
                     children_count = len(proc.children())
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     children_count = 0
 
-                try:
-                    username = proc.username()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    username = ""
-
-                has_open_files = self._check_open_files_in_home(proc)
                 category = self._categorize_process(name, cmdline)
-                is_protected = self._is_protected(pid, category, children_count, has_open_files)
+                is_protected = self._is_protected(pid, category, children_count)
+
+                # open_files() is by far the most expensive psutil call, so only
+                # make it when no cheaper predicate already protects the process
+                has_open_files = not is_protected and self._check_open_files_in_home(proc)
+                is_protected = is_protected or has_open_files
 
                 kill_score = self._calculate_score(
                     cpu_percent, memory_percent, num_fds,
@@ -342,16 +435,68 @@ class ProcessScorer:
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             return None
 
-    def get_all_processes(self, min_cpu: float = 0.0) -> List[ProcessInfo]:
-        """Get all processes with optional CPU filter"""
-        processes = []
+    def _refresh_process_handles(self) -> List[psutil.Process]:
+        """
+        Diff the live PID table against the handles kept from earlier polls
+        Returns: Process handles for every live PID
+        """
+        live_pids = set(psutil.pids())
+        handles = self._process_handles
+
+        for pid in handles.keys() - live_pids:
+            del handles[pid]
+            self._static_cache.pop(pid, None)
+
+        # A kept handle caches its create_time, so PID reuse between polls
+        # only shows up through is_running()'s fresh identity check; such
+        # PIDs get a new handle and lose the old process's static info
+        for pid in handles.keys() & live_pids:
+            if not handles[pid].is_running():
+                del handles[pid]
+                self._static_cache.pop(pid, None)
+
+        # Reused handles keep psutil's per-instance cpu_percent baseline
+        for pid in live_pids - handles.keys():
+            try:
+                handles[pid] = psutil.Process(pid)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
 
-        for proc in psutil.process_iter():
-            info = self.analyze_process(proc)
-            if info and info.cpu_percent >= min_cpu:
-                processes.append(info)
+        return list(handles.values())
 
-        return sorted(processes, key=lambda x: x.kill_score, reverse=True)
+    def _select_candidates(self, min_cpu: float) -> Tuple[List[psutil.Process], List[float]]:
+        """
+        Cheap first pass: only processes that pass the CPU filter get the
+        full analysis. The sampled value is handed on because a second
+        cpu_percent() call would measure a near-zero interval
+        Returns: (candidate processes, their cpu_percent samples)
+        """
+        candidates, cpu_samples = [], []
+        for proc in self._refresh_process_handles():
+            try:
+                cpu_percent = proc.cpu_percent()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+            if cpu_percent >= min_cpu:
+                candidates.append(proc)
+                cpu_samples.append(cpu_percent)
+        return candidates, cpu_samples
+
+    def iter_all_processes(self, min_cpu: float = 0.0) -> Iterator[ProcessInfo]:
+        """Yield analyzed processes (unsorted) with optional CPU filter"""
+        candidates, cpu_samples = self._select_candidates(min_cpu)
+        if not candidates:
+            return
+
+        now = time.time()
+        with ThreadPoolExecutor(max_workers=min(self.MAX_ANALYZE_WORKERS, len(candidates))) as executor:
+            for info in executor.map(self.analyze_process, candidates, cpu_samples, repeat(now)):
+                if info:
+                    yield info
+
+    def get_all_processes(self, min_cpu: float = 0.0) -> List[ProcessInfo]:
+        """Get all processes with optional CPU filter"""
+        return sorted(self.iter_all_processes(min_cpu), key=lambda x: x.kill_score, reverse=True)
 
     def get_killable_processes(self, min_score: float = 30.0,
                                min_cpu: float = 20.0) -> List[ProcessInfo]:
@@ -361,8 +506,8 @@ class ProcessScorer:
 
     def get_top_resource_hogs(self, limit: int = 10) -> List[ProcessInfo]:
         """Get top resource-consuming processes"""
-        all_procs = self.get_all_processes(min_cpu=1.0)
-        return all_procs[:limit]
+        return heapq.nlargest(limit, self.iter_all_processes(min_cpu=1.0),
+                              key=lambda x: x.kill_score)
 
     def kill_process_gracefully(self, pid: int, timeout: float = 2.0) -> bool:
         """
@@ -403,9 +548,110 @@ class ProcessScorer:
             logger.error(f"Error killing process {pid}: {e}")
             return False
 
+    def _is_protected_in_tree(self, proc: psutil.Process) -> bool:
+        """
+        Protection check for tree kills, where having children doesn't count
+        kill_process_tree refuses the ancestors of a protected process itself
+        """
+        try:
+            with proc.oneshot():
+                name = proc.name()
+                try:
+                    cmdline = " ".join(proc.cmdline())
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    cmdline = ""
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return False
+
+        category = self._categorize_process(name, cmdline)
+        if self._is_protected(proc.pid, category, children_count=0):
+            return True
+        return self._check_open_files_in_home(proc)
+
+    @staticmethod
+    def _has_exited(proc: psutil.Process) -> bool:
+        """A zombie has exited even if its new parent hasn't reaped it yet"""
+        try:
+            return proc.status() == psutil.STATUS_ZOMBIE
+        except psutil.NoSuchProcess:
+            return True
+
+    def _terminate_all(self, targets: List[psutil.Process],
+                       timeout: float) -> Tuple[List[psutil.Process], List[psutil.Process]]:
+        """
+        SIGTERM every target at once, one shared wait, then SIGKILL for
+        survivors - about one timeout in total, not one per process
+        Returns: (exited, still_running)
+        """
+        for proc in targets:
+            try:
+                proc.terminate()
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.AccessDenied:
+                logger.error(f"Access denied killing process {proc.pid}")
+
+        gone, alive = psutil.wait_procs(targets, timeout=timeout)
+        exited = list(gone)
+        survivors = []
+        for proc in alive:
+            (exited if self._has_exited(proc) else survivors).append(proc)
+
+        # Force kill whatever ignored SIGTERM
+        for proc in survivors:
+            try:
+                proc.kill()
+                logger.info(f"Process {proc.pid} force killed")
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        gone, alive = psutil.wait_procs(survivors, timeout=1.0)
+        exited.extend(gone)
+        still_running = []
+        for proc in alive:
+            (exited if self._has_exited(proc) else still_running).append(proc)
+
+        return exited, still_running
+
+    def kill_processes_gracefully(self, pids: List[int], timeout: float = 2.0) -> Dict[int, bool]:
+        """
+        Kill several processes with one shared grace period
+        Same checks and SIGTERM -> wait -> SIGKILL as kill_process_gracefully,
+        but the waits overlap instead of running back to back
+        Returns: dict of pid -> True if the process is gone
+        """
+        results = {}
+        targets = []
+        for pid in pids:
+            try:
+                proc = psutil.Process(pid)
+            except psutil.NoSuchProcess:
+                logger.info(f"Process {pid} already terminated")
+                results[pid] = True
+                continue
+
+            # Verify it's still killable
+            info = self.analyze_process(proc)
+            if info and info.is_protected:
+                logger.warning(f"Refusing to kill protected process: {info.name} (PID:{pid})")
+                results[pid] = False
+            else:
+                targets.append(proc)
+
+        try:
+            exited, _ = self._terminate_all(targets, timeout)
+        except Exception as e:
+            logger.error(f"Error killing processes {[proc.pid for proc in targets]}: {e}")
+            exited = []
+
+        exited_pids = {proc.pid for proc in exited}
+        for proc in targets:
+            results[proc.pid] = proc.pid in exited_pids
+        return results
+
     def kill_process_tree(self, pid: int, timeout: float = 2.0) -> int:
         """
         Kill process and all its descendants
+        The whole tree shares one grace period (see _terminate_all)
         Returns count of killed processes
         """
         killed = 0
@@ -413,14 +659,35 @@ class ProcessScorer:
             parent = psutil.Process(pid)
             children = parent.children(recursive=True)
 
-            # Kill children first (in reverse order)
-            for child in reversed(children):
-                if self.kill_process_gracefully(child.pid, timeout=timeout/2):
-                    killed += 1
-
-            # Kill parent
-            if self.kill_process_gracefully(pid, timeout=timeout):
-                killed += 1
+            # Children first (in reverse order), then the parent
+            tree = list(reversed(children)) + [parent]
+            refused = set()
+            for proc in tree:
+                if self._is_protected_in_tree(proc):
+                    logger.warning(f"Refusing to kill protected process: {proc.pid}")
+                    refused.add(proc.pid)
+
+            # The children rule is only waived for subtrees killed as a whole:
+            # an ancestor of a protected process would keep a running child
+            if refused:
+                parent_of = {}
+                for proc in children:
+                    try:
+                        parent_of[proc.pid] = proc.ppid()
+                    except psutil.NoSuchProcess:
+                        pass
+                for protected_pid in list(refused):
+                    ancestor = parent_of.get(protected_pid)
+                    while ancestor is not None and (ancestor in parent_of or ancestor == pid):
+                        if ancestor not in refused:
+                            logger.warning(f"Refusing to kill process with a protected descendant: {ancestor}")
+                            refused.add(ancestor)
+                        ancestor = parent_of.get(ancestor)
+
+            targets = [proc for proc in tree if proc.pid not in refused]
+
+            exited, _ = self._terminate_all(targets, timeout)
+            killed = len(exited)
 
         except psutil.NoSuchProcess:
             pass
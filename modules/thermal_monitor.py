@@ -5,18 +5,43 @@ Detect thermal throttling and temperature issues on macOS
 Inspired by: stats, macoh, VoltageShift patterns
 """
 
+import ctypes
 import subprocess
+import sys
 import re
+import bisect
+import heapq
 import platform
+import shutil
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 from enum import Enum
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import time
+from collections import deque
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# SMC keys in ioreg output: temperatures ("TC0P" = 45.5) and fans ("F0Ac" = 2150).
+# Matched against the raw stdout bytes so the dump is never decoded as a whole
+_RE_SMC = re.compile(rb'"(T[A-Z0-9]{3}|F\dAc)"\s*=\s*(\d+\.?\d*)')
+
+# SMC property names read in-process through IOKit
+_RE_SMC_KEY = re.compile(r'T[A-Z0-9]{3}|F\dAc')
+
+# iStats / osx-cpu-temp output ("CPU temp: 65.0°C", "Fan 0 speed: 2150 RPM")
+_RE_NUMBER = re.compile(r'([\d.]+)')
+_RE_ISTATS = re.compile(
+    r'(?P<kind>CPU|GPU|Battery) temp[^\d\n]*(?P<temp>[\d.]+)'
+    r'|Fan\s*(?P<fan>\d+)[^:\n]*:\s*(?P<rpm>\d+)(?=[^\n]*(?i:rpm))'
+)
+
 
 class ThermalState(Enum):
     """Thermal state classification"""
@@ -36,7 +61,7 @@ class ThrottleState(Enum):
     EMERGENCY = "emergency" # Emergency throttle
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ThermalReading:
     """A single thermal sensor reading"""
     name: str
@@ -45,7 +70,7 @@ class ThermalReading:
     location: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ThermalStatus:
     """Complete thermal status of the system"""
     cpu_temp: float
@@ -58,7 +83,148 @@ class ThermalStatus:
     sensors: List[ThermalReading]
     is_apple_silicon: bool
     timestamp: float
-    recommendations: List[str] = field(default_factory=list)
+    # Recommendations are built on first access; _recommender is bound by
+    # ThermalMonitor.get_status so polls that only read temperatures skip it
+    _recommendations: Optional[List[str]] = field(default=None, repr=False)
+    _recommender: Optional[Callable[['ThermalStatus'], List[str]]] = field(
+        default=None, repr=False, compare=False)
+
+    @property
+    def recommendations(self) -> List[str]:
+        """Thermal management recommendations, generated lazily"""
+        if self._recommendations is None:
+            recommender, self._recommender = self._recommender, None
+            self._recommendations = recommender(self) if recommender else []
+        return self._recommendations
+
+    @recommendations.setter
+    def recommendations(self, value: List[str]):
+        self._recommendations = value
+        self._recommender = None
+
+
+class _IORegistryReader:
+    """
+    Read numeric properties of an IOKit registry entry in-process via
+    ctypes, the same data `ioreg -r -n <name>` prints, without spawning
+    ioreg or parsing its text output
+    """
+
+    IOKIT_PATH = '/System/Library/Frameworks/IOKit.framework/IOKit'
+    CF_PATH = '/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation'
+
+    kIOMainPortDefault = 0  # MACH_PORT_NULL selects the default main port
+    kCFNumberDoubleType = 13
+    kCFStringEncodingUTF8 = 0x08000100
+    KEY_BUFFER_SIZE = 256
+
+    def __init__(self, service_name: str):
+        if sys.platform != 'darwin':
+            raise OSError("IOKit is only available on macOS")
+        self._service_name = service_name.encode('utf-8')
+        self._iokit = ctypes.CDLL(self.IOKIT_PATH)
+        self._cf = ctypes.CDLL(self.CF_PATH)
+        self._declare_prototypes()
+        self._string_type = self._cf.CFStringGetTypeID()
+        self._number_type = self._cf.CFNumberGetTypeID()
+        self._dict_type = self._cf.CFDictionaryGetTypeID()
+        self._key_buffer = ctypes.create_string_buffer(self.KEY_BUFFER_SIZE)
+
+    def _declare_prototypes(self):
+        """Set ctypes signatures so handles aren't truncated to C int"""
+        c_void_p, c_uint32 = ctypes.c_void_p, ctypes.c_uint32
+        iokit, cf = self._iokit, self._cf
+
+        iokit.IOServiceNameMatching.restype = c_void_p
+        iokit.IOServiceNameMatching.argtypes = [ctypes.c_char_p]
+        iokit.IOServiceGetMatchingServices.restype = ctypes.c_int
+        iokit.IOServiceGetMatchingServices.argtypes = [
+            c_uint32, c_void_p, ctypes.POINTER(c_uint32)]
+        iokit.IOIteratorNext.restype = c_uint32
+        iokit.IOIteratorNext.argtypes = [c_uint32]
+        iokit.IORegistryEntryCreateCFProperties.restype = ctypes.c_int
+        iokit.IORegistryEntryCreateCFProperties.argtypes = [
+            c_uint32, ctypes.POINTER(c_void_p), c_void_p, c_uint32]
+        iokit.IOObjectRelease.restype = ctypes.c_int
+        iokit.IOObjectRelease.argtypes = [c_uint32]
+
+        for type_id_func in (cf.CFStringGetTypeID, cf.CFNumberGetTypeID,
+                             cf.CFDictionaryGetTypeID):
+            type_id_func.restype = ctypes.c_ulong
+            type_id_func.argtypes = []
+        cf.CFGetTypeID.restype = ctypes.c_ulong
+        cf.CFGetTypeID.argtypes = [c_void_p]
+        cf.CFDictionaryGetCount.restype = ctypes.c_long
+        cf.CFDictionaryGetCount.argtypes = [c_void_p]
+        cf.CFDictionaryGetKeysAndValues.restype = None
+        cf.CFDictionaryGetKeysAndValues.argtypes = [
+            c_void_p, ctypes.POINTER(c_void_p), ctypes.POINTER(c_void_p)]
+        cf.CFStringGetCString.restype = ctypes.c_bool
+        cf.CFStringGetCString.argtypes = [
+            c_void_p, ctypes.c_char_p, ctypes.c_long, c_uint32]
+        cf.CFNumberGetValue.restype = ctypes.c_bool
+        cf.CFNumberGetValue.argtypes = [c_void_p, ctypes.c_long, c_void_p]
+        cf.CFRelease.restype = None
+        cf.CFRelease.argtypes = [c_void_p]
+
+    def read(self) -> Dict[str, float]:
+        """
+        Read every numeric property of the matching registry entries,
+        including those nested in dictionary-valued properties
+        Returns: dict of property name -> value
+        """
+        iterator = ctypes.c_uint32()
+        matching = self._iokit.IOServiceNameMatching(self._service_name)
+        # IOServiceGetMatchingServices consumes the matching dictionary
+        kr = self._iokit.IOServiceGetMatchingServices(
+            self.kIOMainPortDefault, matching, ctypes.byref(iterator))
+        if kr != 0:
+            raise OSError(f"IOServiceGetMatchingServices failed: {kr:#x}")
+
+        values = {}
+        try:
+            while True:
+                service = self._iokit.IOIteratorNext(iterator)
+                if not service:
+                    break
+                try:
+                    props = ctypes.c_void_p()
+                    kr = self._iokit.IORegistryEntryCreateCFProperties(
+                        service, ctypes.byref(props), None, 0)
+                    if kr == 0 and props.value:
+                        try:
+                            self._collect_numbers(props.value, values)
+                        finally:
+                            self._cf.CFRelease(props)
+                finally:
+                    self._iokit.IOObjectRelease(service)
+        finally:
+            self._iokit.IOObjectRelease(iterator)
+        return values
+
+    def _collect_numbers(self, cf_dict: int, values: Dict[str, float]):
+        """Copy the string-keyed CFNumber entries of a CFDictionary into values"""
+        cf = self._cf
+        count = cf.CFDictionaryGetCount(cf_dict)
+        if count <= 0:
+            return
+        keys = (ctypes.c_void_p * count)()
+        refs = (ctypes.c_void_p * count)()
+        cf.CFDictionaryGetKeysAndValues(cf_dict, keys, refs)
+
+        number = ctypes.c_double()
+        for key, ref in zip(keys, refs):
+            if not key or not ref:
+                continue
+            ref_type = cf.CFGetTypeID(ref)
+            if ref_type == self._dict_type:
+                self._collect_numbers(ref, values)
+            elif ref_type == self._number_type and cf.CFGetTypeID(key) == self._string_type:
+                if (cf.CFStringGetCString(key, self._key_buffer, self.KEY_BUFFER_SIZE,
+                                          self.kCFStringEncodingUTF8)
+                        and cf.CFNumberGetValue(ref, self.kCFNumberDoubleType,
+                                                ctypes.byref(number))):
+                    values[self._key_buffer.value.decode('utf-8')] = number.value
 
 
 class ThermalMonitor:
@@ -83,6 +249,19 @@ class ThermalMonitor:
         ThermalState.DANGER: 100,
     }
 
+    # _get_temperature_state bisects into these: a temperature below
+    # _STATE_BOUNDS[i] (and not below the previous bound) is _BOUNDED_STATES[i]
+    _STATE_BOUNDS = (
+        THRESHOLDS[ThermalState.COOL],
+        THRESHOLDS[ThermalState.WARM],
+        THRESHOLDS[ThermalState.HOT],
+        THRESHOLDS[ThermalState.CRITICAL],
+    )
+    _BOUNDED_STATES = (
+        ThermalState.COOL, ThermalState.WARM, ThermalState.HOT,
+        ThermalState.CRITICAL, ThermalState.DANGER,
+    )
+
     # Intel-specific sensor names
     INTEL_SENSORS = {
         'cpu': ['TC0P', 'TC0H', 'TC0D', 'TC0E', 'TC0F', 'CPU Core'],
@@ -99,77 +278,165 @@ class ThermalMonitor:
         'ambient': ['Ambient', 'Air'],
     }
 
+    # SMC key prefix -> sensor location
+    SENSOR_LOCATIONS = {
+        'TC': 'CPU',
+        'TG': 'GPU',
+        'TB': 'Battery',
+        'TA': 'Ambient',
+        'TH': 'Heatsink',
+        'TM': 'Memory',
+        'Tp': 'Power Supply',
+        'TW': 'Wireless',
+    }
+
+    # Locations whose first valid sensor fills a ThermalStatus summary field
+    _SUMMARY_TEMP_KEYS = {
+        'CPU': 'cpu',
+        'GPU': 'gpu',
+        'Battery': 'battery',
+        'Ambient': 'ambient',
+    }
+
+    # SMC key prefixes (CPU, GPU, battery) whose presence makes iStats redundant
+    _ISTATS_SMC_PREFIXES = frozenset({'TC', 'TG', 'TB'})
+
+    # Temperature and fan parsing share one ioreg dump per poll
+    IOREG_SMC_CMD = ['ioreg', '-r', '-n', 'AppleSMC', '-d', '1']
+    IOREG_CACHE_SECONDS = 0.5
+
+    # How long get_status_adaptive() reuses a reading, by CPU thermal state
+    ADAPTIVE_POLL_SECONDS = {
+        ThermalState.COOL: 5.0,
+        ThermalState.WARM: 2.0,
+        ThermalState.HOT: 1.0,
+        ThermalState.CRITICAL: 0.25,
+        ThermalState.DANGER: 0.25,
+    }
+
     def __init__(self):
         self.is_apple_silicon = self._detect_apple_silicon()
         self._powermetrics_available = self._check_powermetrics()
         self._last_status: Optional[ThermalStatus] = None
-        self._history: List[ThermalStatus] = []
         self._max_history = 60  # Keep 60 readings for trend analysis
-
-    def _detect_apple_silicon(self) -> bool:
+        self._history: Deque[ThermalStatus] = deque(maxlen=self._max_history)
+        self._ioreg_cache: Optional[Tuple[float, bytes]] = None  # (time.monotonic(), stdout)
+        self._smc_reader = self._open_smc_reader()  # None -> spawn ioreg instead
+        self._kernel_task_proc = None  # psutil.Process, resolved on first throttle check
+        self._kernel_task_searched = False
+
+    # Hardware and tool availability can't change while the app runs, so
+    # detect once per process rather than once per monitor instance
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _detect_apple_silicon() -> bool:
         """Detect if running on Apple Silicon"""
-        return platform.processor() == 'arm' or 'Apple' in platform.processor()
+        processor = platform.processor()
+        return processor == 'arm' or 'Apple' in processor
 
-    def _check_powermetrics(self) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _check_powermetrics() -> bool:
         """Check if powermetrics is available (requires sudo)"""
+        return shutil.which('powermetrics') is not None
+
+    @staticmethod
+    def _open_smc_reader() -> Optional[_IORegistryReader]:
+        """Open the in-process AppleSMC reader, or None where IOKit can't be loaded"""
         try:
-            result = subprocess.run(
-                ['which', 'powermetrics'],
-                capture_output=True,
-                text=True
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+            return _IORegistryReader('AppleSMC')
+        except (OSError, AttributeError) as e:
+            logger.debug(f"IOKit unavailable, using ioreg for SMC data: {e}")
+            return None
 
     def _get_temperature_state(self, temp: float) -> ThermalState:
         """Classify temperature into thermal state"""
-        if temp < self.THRESHOLDS[ThermalState.COOL]:
-            return ThermalState.COOL
-        elif temp < self.THRESHOLDS[ThermalState.WARM]:
-            return ThermalState.WARM
-        elif temp < self.THRESHOLDS[ThermalState.HOT]:
-            return ThermalState.HOT
-        elif temp < self.THRESHOLDS[ThermalState.CRITICAL]:
-            return ThermalState.CRITICAL
-        else:
-            return ThermalState.DANGER
+        return self._BOUNDED_STATES[bisect.bisect_right(self._STATE_BOUNDS, temp)]
 
-    def _parse_ioreg_thermal(self) -> Dict[str, float]:
+    def _ioreg_applesmc_dump(self) -> bytes:
         """
-        Parse thermal data from ioreg (works without sudo)
-        This is the most reliable method for basic temperature data
+        Get AppleSMC data from ioreg, spawning it at most once per
+        IOREG_CACHE_SECONDS so temperature and fan parsing share one dump
         """
-        temps = {}
+        now = time.monotonic()
+        if self._ioreg_cache is not None and now - self._ioreg_cache[0] < self.IOREG_CACHE_SECONDS:
+            return self._ioreg_cache[1]
 
+        output = b""
         try:
-            # Get AppleSMC data
             result = subprocess.run(
-                ['ioreg', '-r', '-n', 'AppleSMC', '-d', '1'],
+                self.IOREG_SMC_CMD,
                 capture_output=True,
-                text=True,
                 timeout=5
             )
-
-            # Parse for temperature values
-            # Look for patterns like "TC0P" = 45.5
-            for line in result.stdout.split('\n'):
-                # Temperature keys typically start with 'T'
-                match = re.search(r'"(T[A-Z0-9]{3})"\s*=\s*(\d+\.?\d*)', line)
-                if match:
-                    key = match.group(1)
-                    value = float(match.group(2))
-                    # SMC reports in different scales, normalize to Celsius
-                    if value > 200:  # Likely in centi-degrees
-                        value = value / 100
-                    elif value > 120:  # Likely in deci-degrees
-                        value = value / 10
-                    temps[key] = value
-
+            output = result.stdout
         except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
             logger.warning(f"Failed to get ioreg thermal data: {e}")
 
-        return temps
+        self._ioreg_cache = (now, output)
+        return output
+
+    def _read_smc(self) -> Tuple[Dict[str, float], Dict[str, int]]:
+        """
+        Read SMC temperatures and fans straight from IOKit, falling back to
+        an ioreg dump when the in-process reader is unavailable or fails
+        Returns: (temperatures in Celsius, fan speeds in RPM)
+        """
+        if self._smc_reader is not None:
+            try:
+                properties = self._smc_reader.read()
+                return self._split_smc(
+                    (key, value) for key, value in properties.items()
+                    if _RE_SMC_KEY.fullmatch(key)
+                )
+            except OSError as e:
+                logger.warning(f"IOKit SMC read failed, falling back to ioreg: {e}")
+                self._smc_reader = None
+        return self._scan_smc(self._ioreg_applesmc_dump())
+
+    def _scan_smc(self, ioreg_output: bytes) -> Tuple[Dict[str, float], Dict[str, int]]:
+        """
+        Scan an AppleSMC dump once for both temperature and fan keys
+        Returns: (temperatures in Celsius, fan speeds in RPM)
+        """
+        # One finditer pass over the whole dump, no per-line split; only the
+        # matched keys are decoded (float() accepts the ASCII value bytes)
+        return self._split_smc(
+            (match.group(1).decode('ascii'), match.group(2))
+            for match in _RE_SMC.finditer(ioreg_output)
+        )
+
+    @staticmethod
+    def _split_smc(pairs) -> Tuple[Dict[str, float], Dict[str, int]]:
+        """
+        Sort (SMC key, value) pairs into temperatures and fan speeds
+        Returns: (temperatures in Celsius, fan speeds in RPM)
+        """
+        temps = {}
+        fans = {}
+
+        for key, raw_value in pairs:
+            if key[0] == 'T':
+                value = float(raw_value)
+                # SMC reports in different scales, normalize to Celsius
+                if value > 200:  # Likely in centi-degrees
+                    value = value / 100
+                elif value > 120:  # Likely in deci-degrees
+                    value = value / 10
+                temps[key] = value
+            else:
+                fans[key] = int(float(raw_value))
+
+        return temps, fans
+
+    def _parse_ioreg_thermal(self, ioreg_output: Optional[bytes] = None) -> Dict[str, float]:
+        """
+        Parse thermal data from ioreg (works without sudo)
+        This is the most reliable method for basic temperature data
+        """
+        if ioreg_output is None:
+            return self._read_smc()[0]
+        return self._scan_smc(ioreg_output)[0]
 
     def _parse_osx_cpu_temp(self) -> Optional[float]:
         """
@@ -185,7 +452,7 @@ class ThermalMonitor:
             )
             if result.returncode == 0:
                 # Output like: "65.0°C"
-                match = re.search(r'([\d.]+)', result.stdout)
+                match = _RE_NUMBER.search(result.stdout)
                 if match:
                     return float(match.group(1))
         except (FileNotFoundError, subprocess.TimeoutExpired):
@@ -208,58 +475,56 @@ class ThermalMonitor:
             )
 
             if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    # Parse lines like "CPU temp: 65.0°C"
-                    if 'CPU temp' in line:
-                        match = re.search(r'([\d.]+)', line)
-                        if match:
-                            temps['cpu'] = float(match.group(1))
-                    elif 'GPU temp' in line:
-                        match = re.search(r'([\d.]+)', line)
-                        if match:
-                            temps['gpu'] = float(match.group(1))
-                    elif 'Battery temp' in line:
-                        match = re.search(r'([\d.]+)', line)
-                        if match:
-                            temps['battery'] = float(match.group(1))
-                    elif 'Fan' in line and 'rpm' in line.lower():
-                        match = re.search(r'Fan\s*(\d+)[^:]*:\s*(\d+)', line)
-                        if match:
-                            fan_num = match.group(1)
-                            rpm = int(match.group(2))
-                            temps[f'fan_{fan_num}'] = rpm
+                # Lines like "CPU temp: 65.0°C" and "Fan 0 speed: 2150 RPM",
+                # picked out in one scan of the whole output
+                for match in _RE_ISTATS.finditer(result.stdout):
+                    kind = match.group('kind')
+                    if kind:
+                        temps[kind.lower()] = float(match.group('temp'))
+                    else:
+                        temps[f"fan_{match.group('fan')}"] = int(match.group('rpm'))
 
         except (FileNotFoundError, subprocess.TimeoutExpired):
             pass
 
         return temps
 
-    def _get_fan_speeds(self) -> Dict[str, int]:
+    def _get_fan_speeds(self, ioreg_output: Optional[bytes] = None) -> Dict[str, int]:
         """Get fan speeds from SMC"""
-        fans = {}
+        if ioreg_output is None:
+            return self._read_smc()[1]
+        return self._scan_smc(ioreg_output)[1]
+
+    def _find_kernel_task(self):
+        """Locate kernel_task once; later polls reuse the cached handle"""
+        if not self._kernel_task_searched:
+            self._kernel_task_searched = True
+            import psutil
+            for proc in psutil.process_iter(['name']):
+                if proc.info['name'] == 'kernel_task':
+                    self._kernel_task_proc = proc
+                    break
+        return self._kernel_task_proc
 
+    def _get_kernel_task_cpu(self) -> Optional[float]:
+        """Get kernel_task CPU usage (macOS thermal throttle indicator)"""
         try:
-            result = subprocess.run(
-                ['ioreg', '-r', '-n', 'AppleSMC', '-d', '1'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            # Look for fan speed patterns (F0Ac, F1Ac, etc.)
-            for line in result.stdout.split('\n'):
-                match = re.search(r'"(F\dAc)"\s*=\s*(\d+)', line)
-                if match:
-                    fan_id = match.group(1)
-                    rpm = int(match.group(2))
-                    fans[fan_id] = rpm
-
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            import psutil
+            proc = self._find_kernel_task()
+            if proc is None:
+                return None
+            try:
+                return proc.cpu_percent(interval=None)
+            except psutil.NoSuchProcess:
+                # Stale handle: search again on the next poll
+                self._kernel_task_proc = None
+                self._kernel_task_searched = False
+        except Exception:
             pass
+        return None
 
-        return fans
-
-    def _detect_throttle(self, cpu_temp: float, cpu_percent: Optional[float] = None) -> ThrottleState:
+    def _detect_throttle(self, cpu_temp: float, cpu_percent: Optional[float] = None,
+                         kernel_cpu: Optional[float] = None) -> ThrottleState:
         """
         Detect CPU throttling based on temperature and CPU usage patterns
 
@@ -269,22 +534,18 @@ class ThermalMonitor:
         - kernel_task high CPU (macOS thermal protection)
         """
         # Check kernel_task CPU usage (macOS thermal throttle indicator)
-        try:
-            import psutil
-            for proc in psutil.process_iter(['name', 'cpu_percent']):
-                if proc.info['name'] == 'kernel_task':
-                    kernel_cpu = proc.info['cpu_percent']
-                    if kernel_cpu > 100:  # kernel_task using >100% CPU
-                        if cpu_temp > self.THRESHOLDS[ThermalState.CRITICAL]:
-                            return ThrottleState.EMERGENCY
-                        elif cpu_temp > self.THRESHOLDS[ThermalState.HOT]:
-                            return ThrottleState.HEAVY
-                        else:
-                            return ThrottleState.MODERATE
-                    elif kernel_cpu > 50:
-                        return ThrottleState.LIGHT
-        except Exception:
-            pass
+        if kernel_cpu is None:
+            kernel_cpu = self._get_kernel_task_cpu()
+        if kernel_cpu is not None:
+            if kernel_cpu > 100:  # kernel_task using >100% CPU
+                if cpu_temp > self.THRESHOLDS[ThermalState.CRITICAL]:
+                    return ThrottleState.EMERGENCY
+                elif cpu_temp > self.THRESHOLDS[ThermalState.HOT]:
+                    return ThrottleState.HEAVY
+                else:
+                    return ThrottleState.MODERATE
+            elif kernel_cpu > 50:
+                return ThrottleState.LIGHT
 
         # Temperature-based throttle estimation
         if cpu_temp >= self.THRESHOLDS[ThermalState.DANGER]:
@@ -298,7 +559,15 @@ class ThermalMonitor:
 
         return ThrottleState.NONE
 
-    def _generate_recommendations(self, status: 'ThermalStatus') -> List[str]:
+    def _is_temp_rising(self) -> bool:
+        """Whether the last five CPU readings in history rose monotonically"""
+        if len(self._history) < 5:
+            return False
+        recent_temps = [self._history[i].cpu_temp for i in range(-5, 0)]
+        return all(recent_temps[i] < recent_temps[i+1] for i in range(len(recent_temps)-1))
+
+    def _generate_recommendations(self, status: 'ThermalStatus',
+                                  temp_rising: bool = False) -> List[str]:
         """Generate recommendations based on thermal status"""
         recommendations = []
 
@@ -332,13 +601,48 @@ class ThermalMonitor:
             recommendations.append("🔋 Battery temperature elevated - avoid charging during heavy use")
 
         # Trend analysis
-        if len(self._history) >= 5:
-            recent_temps = [h.cpu_temp for h in self._history[-5:]]
-            if all(recent_temps[i] < recent_temps[i+1] for i in range(len(recent_temps)-1)):
-                recommendations.append("📈 Temperature rising consistently - consider reducing load")
+        if temp_rising:
+            recommendations.append("📈 Temperature rising consistently - consider reducing load")
 
         return recommendations
 
+    def _collect_raw(self) -> Dict[str, object]:
+        """
+        Gather every external reading for one poll in a single pass, with the
+        blocking subprocess and psutil calls overlapped on a small pool
+        Returns: dict of ioreg_temps, ioreg_fans, osx_cpu_temp, istats, kernel_task_cpu
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            kernel_future = executor.submit(self._get_kernel_task_cpu)
+
+            # The SMC (IOKit, or ioreg as a fallback) is always present and one
+            # read also yields the fans; read it first so the external tools
+            # can be skipped for readings it already has
+            ioreg_temps, ioreg_fans = self._read_smc()
+            ioreg_prefixes = {key[:2] for key, value in ioreg_temps.items() if 30 < value < 120}
+
+            # osx-cpu-temp and iStats read the same SMC keys ioreg exposes, so
+            # each is only spawned (concurrently) when the SMC lacks what it
+            # adds: the CPU for osx-cpu-temp, and CPU, GPU or battery for iStats
+            osx_future = istats_future = None
+            if 'TC' not in ioreg_prefixes:
+                osx_future = executor.submit(self._parse_osx_cpu_temp)
+            if not self._ISTATS_SMC_PREFIXES <= ioreg_prefixes:
+                istats_future = executor.submit(self._parse_istats)
+
+            istats = istats_future.result() if istats_future else {}
+            if 'TC' in ioreg_prefixes:
+                # The SMC CPU reading stands in for osx-cpu-temp, so it wins here too
+                istats.pop('cpu', None)
+
+            return {
+                'ioreg_temps': ioreg_temps,
+                'ioreg_fans': ioreg_fans,
+                'osx_cpu_temp': osx_future.result() if osx_future else None,
+                'istats': istats,
+                'kernel_task_cpu': kernel_future.result(),
+            }
+
     def get_status(self, include_sensors: bool = True) -> ThermalStatus:
         """
         Get comprehensive thermal status
@@ -351,15 +655,19 @@ class ThermalMonitor:
         """
         sensors = []
         temps = {}
-
-        # Try multiple sources for temperature data
-        # 1. Try osx-cpu-temp first (most accurate)
-        cpu_temp = self._parse_osx_cpu_temp()
+        raw = self._collect_raw()
+        ioreg_temps = raw['ioreg_temps']
+        ioreg_fans = raw['ioreg_fans']
+        istats_data = raw['istats']
+
+        # Try multiple sources for temperature data; osx-cpu-temp and iStats
+        # only ran if the SMC read lacked their readings (see _collect_raw)
+        # 1. osx-cpu-temp, when it ran
+        cpu_temp = raw['osx_cpu_temp']
         if cpu_temp:
             temps['cpu'] = cpu_temp
 
-        # 2. Try iStats
-        istats_data = self._parse_istats()
+        # 2. iStats, when it ran
         if istats_data:
             if 'cpu' not in temps and 'cpu' in istats_data:
                 temps['cpu'] = istats_data['cpu']
@@ -368,28 +676,24 @@ class ThermalMonitor:
             if 'battery' in istats_data:
                 temps['battery'] = istats_data['battery']
 
-        # 3. Parse ioreg for additional sensors
-        ioreg_temps = self._parse_ioreg_thermal()
+        # 3. The SMC read fills everything else
         for key, value in ioreg_temps.items():
             if 30 < value < 120:  # Sanity check for valid temps
+                # One prefix lookup serves both the reading and the summary
+                location = self.SENSOR_LOCATIONS.get(key[:2], 'Unknown')
                 if include_sensors:
                     state = self._get_temperature_state(value)
                     sensors.append(ThermalReading(
                         name=key,
                         temperature=value,
                         state=state,
-                        location=self._classify_sensor_location(key)
+                        location=location
                     ))
 
                 # Map to main categories if not already set
-                if key.startswith('TC') and 'cpu' not in temps:
-                    temps['cpu'] = value
-                elif key.startswith('TG') and 'gpu' not in temps:
-                    temps['gpu'] = value
-                elif key.startswith('TB') and 'battery' not in temps:
-                    temps['battery'] = value
-                elif key.startswith('TA') and 'ambient' not in temps:
-                    temps['ambient'] = value
+                temp_key = self._SUMMARY_TEMP_KEYS.get(location)
+                if temp_key is not None and temp_key not in temps:
+                    temps[temp_key] = value
 
         # Default values if sensors not available
         cpu_temp = temps.get('cpu', 0)
@@ -398,7 +702,7 @@ class ThermalMonitor:
         ambient_temp = temps.get('ambient', 0)
 
         # Get fan speeds
-        fan_speeds = self._get_fan_speeds()
+        fan_speeds = ioreg_fans
         # Also check iStats fans
         for key, value in istats_data.items():
             if key.startswith('fan_'):
@@ -406,7 +710,7 @@ class ThermalMonitor:
 
         # Determine states
         cpu_state = self._get_temperature_state(cpu_temp) if cpu_temp else ThermalState.COOL
-        throttle_state = self._detect_throttle(cpu_temp)
+        throttle_state = self._detect_throttle(cpu_temp, kernel_cpu=raw['kernel_task_cpu'])
 
         # Create status object
         status = ThermalStatus(
@@ -422,37 +726,33 @@ class ThermalMonitor:
             timestamp=time.time()
         )
 
-        # Generate recommendations
-        status.recommendations = self._generate_recommendations(status)
+        # Recommendations are generated on first access; the trend is captured
+        # now because history will have moved on by then
+        status._recommender = partial(self._generate_recommendations,
+                                      temp_rising=self._is_temp_rising())
 
         # Update history
         self._last_status = status
-        self._history.append(status)
-        if len(self._history) > self._max_history:
-            self._history.pop(0)
+        self._history.append(status)  # deque(maxlen) evicts the oldest
 
         return status
 
+    def get_status_adaptive(self, include_sensors: bool = True) -> ThermalStatus:
+        """
+        Get thermal status, reusing the last reading for a state-dependent
+        interval: temperatures move on a seconds scale, so a cool machine
+        is sampled every few seconds and a hot one near continuously
+        """
+        last = self._last_status
+        if last is not None:
+            max_age = self.ADAPTIVE_POLL_SECONDS.get(last.cpu_state, 1.0)
+            if time.time() - last.timestamp < max_age:
+                return last
+        return self.get_status(include_sensors=include_sensors)
+
     def _classify_sensor_location(self, sensor_key: str) -> str:
         """Classify sensor location based on key"""
-        if sensor_key.startswith('TC'):
-            return 'CPU'
-        elif sensor_key.startswith('TG'):
-            return 'GPU'
-        elif sensor_key.startswith('TB'):
-            return 'Battery'
-        elif sensor_key.startswith('TA'):
-            return 'Ambient'
-        elif sensor_key.startswith('TH'):
-            return 'Heatsink'
-        elif sensor_key.startswith('TM'):
-            return 'Memory'
-        elif sensor_key.startswith('Tp'):
-            return 'Power Supply'
-        elif sensor_key.startswith('TW'):
-            return 'Wireless'
-        else:
-            return 'Unknown'
+        return self.SENSOR_LOCATIONS.get(sensor_key[:2], 'Unknown')
 
     def get_temperature_emoji(self, state: ThermalState) -> str:
         """Get emoji for thermal state"""
@@ -476,20 +776,31 @@ class ThermalMonitor:
         }
         return emojis.get(state, "❓")
 
+    def _get_cpu_temp_fast(self) -> float:
+        """
+        Get CPU temperature from the cheapest source that has one: the
+        SMC (IOKit or cached ioreg dump), else osx-cpu-temp (0 if neither
+        reports it)
+        """
+        ioreg_temps, _ = self._read_smc()
+        for key, value in ioreg_temps.items():
+            if key.startswith('TC') and 30 < value < 120:
+                return value
+        return self._parse_osx_cpu_temp() or 0
+
     def is_throttling(self) -> bool:
         """Quick check if CPU is currently throttling"""
         if self._last_status:
             return self._last_status.throttle_state != ThrottleState.NONE
-        status = self.get_status(include_sensors=False)
-        return status.throttle_state != ThrottleState.NONE
+        return self._detect_throttle(self._get_cpu_temp_fast()) != ThrottleState.NONE
 
     def get_trend(self) -> str:
         """Get temperature trend from history"""
         if len(self._history) < 3:
             return "stable"
 
-        recent = [h.cpu_temp for h in self._history[-3:]]
-        avg_change = (recent[-1] - recent[0]) / len(recent)
+        # Only the endpoints of the last three readings matter
+        avg_change = (self._history[-1].cpu_temp - self._history[-3].cpu_temp) / 3
 
         if avg_change > 2:
             return "rising_fast"
@@ -535,7 +846,7 @@ def main():
 
     if status.sensors:
         print(f"\n📊 All Sensors ({len(status.sensors)} detected):")
-        for sensor in sorted(status.sensors, key=lambda x: x.temperature, reverse=True)[:10]:
+        for sensor in heapq.nlargest(10, status.sensors, key=lambda x: x.temperature):
             print(f"   {sensor.name:8s} ({sensor.location:10s}): {sensor.temperature:.1f}°C")
 
     if status.recommendations:
@@ -10,14 +10,21 @@ Usage:
     python system-optimizer.py cleanup --aggressive  # Aggressive cleanup
     python system-optimizer.py monitor         # Continuous monitoring
     python system-optimizer.py analyze         # Full system analysis
+    python system-optimizer.py analyze --with-sensors  # Include per-sensor temperatures
 """
 
 import argparse
+import heapq
+import io
 import sys
 import os
 import time
-import signal
-from typing import Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, partial
+from operator import attrgetter
+from typing import Callable, Dict, Optional, Tuple
 
 # Add modules directory to path
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -64,24 +71,138 @@ class SystemOptimizer:
     Unified system optimizer combining all monitoring and cleanup capabilities
     """
 
-    def __init__(self, verbose: bool = False):
+    # Cleanable-space analysis walks every cache directory; status and
+    # analyze reuse one result for this long
+    ANALYZE_CACHE_SECONDS = 60.0
+
+    # run_monitor re-reads the slower probes only once this many base
+    # intervals have passed; CPU is sampled every tick. Thermal is read every
+    # tick while it runs hot, and both are while the interval is backed off
+    MONITOR_THERMAL_EVERY = 4
+    MONITOR_MEMORY_EVERY = 2
+    MONITOR_HOT_STATES = (ThermalState.CRITICAL, ThermalState.DANGER)
+
+    # Adaptive backoff: after each tick whose summed CPU %, memory % and
+    # CPU °C change stays under MONITOR_STABLE_CHANGE, the interval doubles
+    # (up to MONITOR_BACKOFF_MAX_STEPS times, capped at
+    # MONITOR_BACKOFF_MAX_SECONDS). Any change or alert snaps it back
+    MONITOR_STABLE_CHANGE = 2.0
+    MONITOR_BACKOFF_MAX_STEPS = 4
+    MONITOR_BACKOFF_MAX_SECONDS = 30.0
+
+    # Shortest window a non-blocking CPU sample may cover after priming
+    # (psutil advises at least 0.1 s for a meaningful reading)
+    CPU_MIN_SAMPLE_SECONDS = 0.1
+
+    # Display colors: (percent must exceed, color), highest threshold first
+    CPU_COLOR_THRESHOLDS = ((80, Colors.RED), (50, Colors.YELLOW))
+    MEMORY_COLOR_THRESHOLDS = ((85, Colors.RED), (70, Colors.YELLOW))
+    # show_status "Top Processes" row and the ProcessInfo fields it shows
+    TOP_PROCESS_ROW = "   {protected} {name:20s} CPU:{cpu:5.1f}% MEM:{mem:5.1f}%"
+    TOP_PROCESS_FIELDS = attrgetter('is_protected', 'name', 'cpu_percent', 'memory_percent')
+
+    THERMAL_COLORS = {
+        ThermalState.COOL: Colors.CYAN,
+        ThermalState.WARM: Colors.GREEN,
+        ThermalState.HOT: Colors.YELLOW,
+        ThermalState.CRITICAL: Colors.RED,
+        ThermalState.DANGER: Colors.RED + Colors.BOLD,
+    }
+
+    def __init__(self, verbose: bool = False, parallel: bool = True):
         self.verbose = verbose
-        self.process_scorer = ProcessScorer()
-        self.thermal_monitor = ThermalMonitor()
-        self.memory_monitor = MemoryMonitor()
-        self.disk_cleaner = DiskCleaner()
+        self.parallel = parallel  # Overlap independent probes in status/analyze
+        self._out_buf: Optional[io.StringIO] = None  # Set while a report is buffered
+        self._analyze_cache: Optional[Tuple[float, Dict[CleanupCategory, int]]] = None  # (time.monotonic(), result)
+
+        # Prime psutil's system-wide CPU counters so later samples can be
+        # taken with interval=None instead of blocking
+        psutil.cpu_percent(interval=None)
+        self._cpu_primed_at = time.monotonic()
+
+    # Subsystems are built on first use, so e.g. `monitor` never sets up
+    # the disk cleaner or process scorer
+    @cached_property
+    def process_scorer(self) -> ProcessScorer:
+        return ProcessScorer()
+
+    @cached_property
+    def thermal_monitor(self) -> ThermalMonitor:
+        return ThermalMonitor()
+
+    @cached_property
+    def memory_monitor(self) -> MemoryMonitor:
+        return MemoryMonitor()
+
+    @cached_property
+    def disk_cleaner(self) -> DiskCleaner:
+        return DiskCleaner()
+
+    @cached_property
+    def cpu_count(self) -> Optional[int]:
+        """Logical CPU count; fixed for the life of the process"""
+        return psutil.cpu_count()
+
+    def _sample_cpu_percent(self) -> float:
+        """System-wide CPU usage since the previous sample, without blocking for an interval"""
+        # Straight after priming the delta is too short to mean anything
+        remaining = self.CPU_MIN_SAMPLE_SECONDS - (time.monotonic() - self._cpu_primed_at)
+        if remaining > 0:
+            time.sleep(remaining)
+        return psutil.cpu_percent(interval=None)
+
+    def _cached_analyze(self) -> Dict[CleanupCategory, int]:
+        """Get the cleanable-space analysis, walking the disk at most once per ANALYZE_CACHE_SECONDS"""
+        now = time.monotonic()
+        if self._analyze_cache is not None and now - self._analyze_cache[0] < self.ANALYZE_CACHE_SECONDS:
+            return self._analyze_cache[1]
+        analysis = self.disk_cleaner.analyze()
+        self._analyze_cache = (now, analysis)
+        return analysis
+
+    def _run_probes(self, probes: Dict[str, Callable[[], object]]) -> Dict[str, object]:
+        """
+        Run independent data probes, overlapping their blocking calls on a
+        thread pool unless parallel probing is disabled
+        Returns: dict of probe name -> result
+        """
+        if not self.parallel:
+            return {name: probe() for name, probe in probes.items()}
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {name: executor.submit(probe) for name, probe in probes.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def _probe_memory_analysis(self):
+        """Memory stats, leak candidates and top users; run in order since they share a process snapshot"""
+        mem_stats = self.memory_monitor.get_stats()
+        leaks = self.memory_monitor.detect_memory_leaks(threshold_mb=50)
+        top_memory = self.memory_monitor.get_top_memory_processes(5)
+        return mem_stats, leaks, top_memory
 
     def _print(self, msg: str, color: str = ""):
         """Print with optional color"""
         if color:
-            print(f"{color}{msg}{Colors.RESET}")
+            msg = f"{color}{msg}{Colors.RESET}"
+        if self._out_buf is not None:
+            self._out_buf.write(msg + "\n")
         else:
             print(msg)
 
+    @contextmanager
+    def _buffered_output(self):
+        """Collect _print output and write it to stdout in a single call"""
+        self._out_buf = io.StringIO()
+        try:
+            yield
+        finally:
+            sys.stdout.write(self._out_buf.getvalue())
+            sys.stdout.flush()
+            self._out_buf = None
+
     def _print_header(self, title: str):
         """Print a section header"""
         width = 60
-        print()
+        self._print("")
         self._print("=" * width, Colors.CYAN)
         self._print(f" {title}", Colors.BOLD + Colors.CYAN)
         self._print("=" * width, Colors.CYAN)
@@ -93,101 +214,100 @@ class SystemOptimizer:
 
     def _get_cpu_color(self, percent: float) -> str:
         """Get color based on CPU percentage"""
-        if percent > 80:
-            return Colors.RED
-        elif percent > 50:
-            return Colors.YELLOW
+        for threshold, color in self.CPU_COLOR_THRESHOLDS:
+            if percent > threshold:
+                return color
         return Colors.GREEN
 
     def _get_memory_color(self, percent: float) -> str:
         """Get color based on memory percentage"""
-        if percent > 85:
-            return Colors.RED
-        elif percent > 70:
-            return Colors.YELLOW
+        for threshold, color in self.MEMORY_COLOR_THRESHOLDS:
+            if percent > threshold:
+                return color
         return Colors.GREEN
 
     def _get_thermal_color(self, state: ThermalState) -> str:
         """Get color based on thermal state"""
-        colors = {
-            ThermalState.COOL: Colors.CYAN,
-            ThermalState.WARM: Colors.GREEN,
-            ThermalState.HOT: Colors.YELLOW,
-            ThermalState.CRITICAL: Colors.RED,
-            ThermalState.DANGER: Colors.RED + Colors.BOLD,
-        }
-        return colors.get(state, Colors.WHITE)
+        return self.THERMAL_COLORS.get(state, Colors.WHITE)
 
     def show_status(self):
         """Display comprehensive system status"""
-        self._print_header("SYSTEM STATUS")
-
-        # CPU
-        self._print_subheader("🖥️  CPU")
-        cpu_percent = psutil.cpu_percent(interval=0.5)
-        cpu_count = psutil.cpu_count()
-        cpu_freq = psutil.cpu_freq()
-
-        color = self._get_cpu_color(cpu_percent)
-        self._print(f"   Usage:      {cpu_percent:.1f}%", color)
-        self._print(f"   Cores:      {cpu_count}")
-        if cpu_freq:
-            self._print(f"   Frequency:  {cpu_freq.current:.0f} MHz")
-
-        # Memory
-        self._print_subheader("💾 Memory")
-        mem_stats = self.memory_monitor.get_stats()
+        with self._buffered_output():
+            self._print_header("SYSTEM STATUS")
+
+            probes = self._run_probes({
+                'memory': self.memory_monitor.get_stats,
+                'thermal': partial(self.thermal_monitor.get_status, include_sensors=False),
+                'disk': self.disk_cleaner.get_disk_usage,
+                'cleanable': self._cached_analyze,
+                'top': partial(self.process_scorer.get_top_resource_hogs, 5),
+            })
+            # Sampled after the probes, whose runtime gives the delta a real window
+            cpu_percent = self._sample_cpu_percent()
+
+            # CPU
+            self._print_subheader("🖥️  CPU")
+            cpu_freq = psutil.cpu_freq()
+
+            color = self._get_cpu_color(cpu_percent)
+            self._print(f"   Usage:      {cpu_percent:.1f}%", color)
+            self._print(f"   Cores:      {self.cpu_count}")
+            if cpu_freq:
+                self._print(f"   Frequency:  {cpu_freq.current:.0f} MHz")
+
+            # Memory
+            self._print_subheader("💾 Memory")
+            mem_stats = probes['memory']
+
+            color = self._get_memory_color(mem_stats.percent_used)
+            self._print(f"   Used:       {self.memory_monitor.format_bytes(mem_stats.used)} / {self.memory_monitor.format_bytes(mem_stats.total)} ({mem_stats.percent_used:.1f}%)", color)
+            self._print(f"   Available:  {self.memory_monitor.format_bytes(mem_stats.available)}")
+            self._print(f"   Compressed: {self.memory_monitor.format_bytes(mem_stats.compressed)}")
+
+            pressure_color = Colors.GREEN if mem_stats.pressure == MemoryPressure.NORMAL else (
+                Colors.YELLOW if mem_stats.pressure == MemoryPressure.WARN else Colors.RED
+            )
+            self._print(f"   Pressure:   {mem_stats.pressure.value}", pressure_color)
 
-        color = self._get_memory_color(mem_stats.percent_used)
-        self._print(f"   Used:       {self.memory_monitor.format_bytes(mem_stats.used)} / {self.memory_monitor.format_bytes(mem_stats.total)} ({mem_stats.percent_used:.1f}%)", color)
-        self._print(f"   Available:  {self.memory_monitor.format_bytes(mem_stats.available)}")
-        self._print(f"   Compressed: {self.memory_monitor.format_bytes(mem_stats.compressed)}")
+            if mem_stats.swap_used > 0:
+                self._print(f"   Swap Used:  {self.memory_monitor.format_bytes(mem_stats.swap_used)}", Colors.YELLOW)
 
-        pressure_color = Colors.GREEN if mem_stats.pressure == MemoryPressure.NORMAL else (
-            Colors.YELLOW if mem_stats.pressure == MemoryPressure.WARN else Colors.RED
-        )
-        self._print(f"   Pressure:   {mem_stats.pressure.value}", pressure_color)
+            # Thermal
+            self._print_subheader("🌡️  Thermal")
+            thermal = probes['thermal']
 
-        if mem_stats.swap_used > 0:
-            self._print(f"   Swap Used:  {self.memory_monitor.format_bytes(mem_stats.swap_used)}", Colors.YELLOW)
+            color = self._get_thermal_color(thermal.cpu_state)
+            if thermal.cpu_temp > 0:
+                self._print(f"   CPU Temp:   {thermal.cpu_temp:.1f}°C", color)
+            self._print(f"   State:      {thermal.cpu_state.value}", color)
 
-        # Thermal
-        self._print_subheader("🌡️  Thermal")
-        thermal = self.thermal_monitor.get_status(include_sensors=False)
+            if thermal.throttle_state != ThrottleState.NONE:
+                self._print(f"   Throttling: {thermal.throttle_state.value}", Colors.RED)
 
-        color = self._get_thermal_color(thermal.cpu_state)
-        if thermal.cpu_temp > 0:
-            self._print(f"   CPU Temp:   {thermal.cpu_temp:.1f}°C", color)
-        self._print(f"   State:      {thermal.cpu_state.value}", color)
+            if thermal.fan_speeds:
+                fans = ", ".join([f"{k}:{v}rpm" for k, v in thermal.fan_speeds.items()])
+                self._print(f"   Fans:       {fans}")
 
-        if thermal.throttle_state != ThrottleState.NONE:
-            self._print(f"   Throttling: {thermal.throttle_state.value}", Colors.RED)
+            # Disk
+            self._print_subheader("💿 Disk")
+            disk = probes['disk']
+            self._print(f"   Used:       {disk['used_formatted']} / {disk['total_formatted']} ({disk['percent_used']:.1f}%)")
+            self._print(f"   Free:       {disk['free_formatted']}")
 
-        if thermal.fan_speeds:
-            fans = ", ".join([f"{k}:{v}rpm" for k, v in thermal.fan_speeds.items()])
-            self._print(f"   Fans:       {fans}")
+            # Cleanable space preview
+            analysis = probes['cleanable']
+            total_cleanable = sum(analysis.values())
+            if total_cleanable > 100 * 1024 * 1024:  # > 100MB
+                self._print(f"   Cleanable:  {self.disk_cleaner.format_size(total_cleanable)}", Colors.YELLOW)
 
-        # Disk
-        self._print_subheader("💿 Disk")
-        disk = self.disk_cleaner.get_disk_usage()
-        self._print(f"   Used:       {disk['used_formatted']} / {disk['total_formatted']} ({disk['percent_used']:.1f}%)")
-        self._print(f"   Free:       {disk['free_formatted']}")
+            # Top processes
+            self._print_subheader("📊 Top Processes")
+            row = self.TOP_PROCESS_ROW.format
+            for is_protected, name, cpu, mem in map(self.TOP_PROCESS_FIELDS, probes['top']):
+                self._print(row(protected="🛡️" if is_protected else "  ", name=name[:20], cpu=cpu, mem=mem),
+                            self._get_cpu_color(cpu))
 
-        # Cleanable space preview
-        analysis = self.disk_cleaner.analyze()
-        total_cleanable = sum(analysis.values())
-        if total_cleanable > 100 * 1024 * 1024:  # > 100MB
-            self._print(f"   Cleanable:  {self.disk_cleaner.format_size(total_cleanable)}", Colors.YELLOW)
-
-        # Top processes
-        self._print_subheader("📊 Top Processes")
-        top = self.process_scorer.get_top_resource_hogs(5)
-        for proc in top:
-            protected = "🛡️" if proc.is_protected else "  "
-            color = self._get_cpu_color(proc.cpu_percent)
-            self._print(f"   {protected} {proc.name[:20]:20s} CPU:{proc.cpu_percent:5.1f}% MEM:{proc.memory_percent:5.1f}%", color)
-
-        print()
+            self._print("")
 
     def run_cleanup(self, dry_run: bool = False, aggressive: bool = False,
                     processes: bool = True, caches: bool = True,
@@ -224,11 +344,15 @@ class SystemOptimizer:
             if not killable:
                 self._print("   No killable processes found", Colors.GREEN)
             else:
-                for proc in killable[:10]:
-                    if dry_run:
+                targets = killable[:10]
+                if dry_run:
+                    for proc in targets:
                         self._print(f"   Would kill: {proc.name} (CPU:{proc.cpu_percent:.1f}%, Score:{proc.kill_score:.0f})", Colors.YELLOW)
-                    else:
-                        if self.process_scorer.kill_process_gracefully(proc.pid):
+                else:
+                    # One shared grace period for all targets
+                    killed = self.process_scorer.kill_processes_gracefully([proc.pid for proc in targets])
+                    for proc in targets:
+                        if killed[proc.pid]:
                             self._print(f"   ✅ Killed: {proc.name} (CPU:{proc.cpu_percent:.1f}%)", Colors.GREEN)
                             total_processes_killed += 1
                         else:
@@ -261,6 +385,8 @@ class SystemOptimizer:
                 dry_run=dry_run,
                 progress_callback=progress_callback if self.verbose else None
             )
+            if not dry_run:
+                self._analyze_cache = None  # Cleanable sizes just changed
 
             # Summarize by category
             by_category = {}
@@ -303,185 +429,254 @@ class SystemOptimizer:
 
         print()
 
-    def run_analyze(self):
-        """Run comprehensive system analysis"""
-        self._print_header("SYSTEM ANALYSIS")
-
-        # Process analysis
-        self._print_subheader("🔍 Process Analysis")
-
-        all_procs = self.process_scorer.get_all_processes(min_cpu=0)
-        protected = [p for p in all_procs if p.is_protected]
-        killable = [p for p in all_procs if not p.is_protected and p.kill_score > 20]
-
-        self._print(f"   Total processes:     {len(all_procs)}")
-        self._print(f"   Protected processes: {len(protected)}", Colors.GREEN)
-        self._print(f"   Killable processes:  {len(killable)}", Colors.YELLOW if killable else Colors.GREEN)
-
-        # Category breakdown
-        categories = {}
-        for p in all_procs:
-            cat = p.category.value
-            categories[cat] = categories.get(cat, 0) + 1
-
-        self._print("\n   By category:")
-        for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
-            self._print(f"      {cat:20s}: {count}")
-
-        # Memory analysis
-        self._print_subheader("💾 Memory Analysis")
-
-        mem_stats = self.memory_monitor.get_stats()
-        self._print(f"   Memory pressure:  {mem_stats.pressure.value}")
-        self._print(f"   Pressure level:   {mem_stats.pressure_percent:.1f}%")
-
-        # Check for memory leaks
-        leaks = self.memory_monitor.detect_memory_leaks(threshold_mb=50)
-        if leaks:
-            self._print(f"\n   ⚠️  Potential memory leaks:", Colors.YELLOW)
-            for pid, name, growth in leaks[:5]:
-                self._print(f"      {name} (PID:{pid}): +{growth}MB", Colors.YELLOW)
-
-        # Top memory users
-        self._print("\n   Top memory users:")
-        for proc in self.memory_monitor.get_top_memory_processes(5):
-            self._print(f"      {proc.name[:20]:20s}: {self.memory_monitor.format_bytes(proc.rss)}")
-
-        # Thermal analysis
-        self._print_subheader("🌡️  Thermal Analysis")
-
-        thermal = self.thermal_monitor.get_status(include_sensors=True)
-        self._print(f"   Platform:     {'Apple Silicon' if thermal.is_apple_silicon else 'Intel'}")
-        self._print(f"   CPU temp:     {thermal.cpu_temp:.1f}°C" if thermal.cpu_temp else "   CPU temp:     N/A")
-        self._print(f"   Thermal state: {thermal.cpu_state.value}")
-        self._print(f"   Throttle:     {thermal.throttle_state.value}")
-
-        if thermal.sensors:
-            self._print("\n   Detected sensors:")
-            for sensor in sorted(thermal.sensors, key=lambda x: x.temperature, reverse=True)[:8]:
-                self._print(f"      {sensor.name:8s} ({sensor.location:10s}): {sensor.temperature:.1f}°C")
-
-        # Disk analysis
-        self._print_subheader("💿 Disk Analysis")
-
-        disk = self.disk_cleaner.get_disk_usage()
-        self._print(f"   Total space:  {disk['total_formatted']}")
-        self._print(f"   Used:         {disk['used_formatted']} ({disk['percent_used']:.1f}%)")
-        self._print(f"   Free:         {disk['free_formatted']}")
-
-        analysis = self.disk_cleaner.analyze()
-        total_cleanable = sum(analysis.values())
-
-        self._print(f"\n   Cleanable space by category:")
-        for category, size in sorted(analysis.items(), key=lambda x: x[1], reverse=True):
-            if size > 10 * 1024 * 1024:  # > 10MB
-                self._print(f"      {category.value:20s}: {self.disk_cleaner.format_size(size)}")
-
-        self._print(f"\n   Total cleanable: {self.disk_cleaner.format_size(total_cleanable)}", Colors.CYAN)
-
-        # Recommendations
-        self._print_subheader("💡 Recommendations")
-
-        recommendations = []
+    def run_analyze(self, with_sensors: bool = False):
+        """Run comprehensive system analysis, listing individual thermal sensors if with_sensors"""
+        with self._buffered_output():
+            self._print_header("SYSTEM ANALYSIS")
+
+            probes = self._run_probes({
+                'processes': partial(self.process_scorer.get_all_processes, min_cpu=0),
+                'memory': self._probe_memory_analysis,
+                'thermal': partial(self.thermal_monitor.get_status, include_sensors=with_sensors),
+                'disk': self.disk_cleaner.get_disk_usage,
+                'cleanable': self._cached_analyze,
+            })
+
+            # Process analysis
+            self._print_subheader("🔍 Process Analysis")
+
+            all_procs = probes['processes']
+
+            # Protection, killability and category counts in a single pass
+            protected_count = killable_count = 0
+            categories = Counter()
+            for p in all_procs:
+                if p.is_protected:
+                    protected_count += 1
+                elif p.kill_score > 20:
+                    killable_count += 1
+                categories[p.category.value] += 1
+
+            self._print(f"   Total processes:     {len(all_procs)}")
+            self._print(f"   Protected processes: {protected_count}", Colors.GREEN)
+            self._print(f"   Killable processes:  {killable_count}", Colors.YELLOW if killable_count else Colors.GREEN)
+
+            # Category breakdown
+
+            self._print("\n   By category:")
+            for cat, count in categories.most_common():
+                self._print(f"      {cat:20s}: {count}")
+
+            # Memory analysis
+            self._print_subheader("💾 Memory Analysis")
+
+            mem_stats, leaks, top_memory = probes['memory']
+            self._print(f"   Memory pressure:  {mem_stats.pressure.value}")
+            self._print(f"   Pressure level:   {mem_stats.pressure_percent:.1f}%")
+
+            # Check for memory leaks
+            if leaks:
+                self._print(f"\n   ⚠️  Potential memory leaks:", Colors.YELLOW)
+                for pid, name, growth in leaks[:5]:
+                    self._print(f"      {name} (PID:{pid}): +{growth}MB", Colors.YELLOW)
+
+            # Top memory users
+            self._print("\n   Top memory users:")
+            for proc in top_memory:
+                self._print(f"      {proc.name[:20]:20s}: {self.memory_monitor.format_bytes(proc.rss)}")
+
+            # Thermal analysis
+            self._print_subheader("🌡️  Thermal Analysis")
+
+            thermal = probes['thermal']
+            self._print(f"   Platform:     {'Apple Silicon' if thermal.is_apple_silicon else 'Intel'}")
+            self._print(f"   CPU temp:     {thermal.cpu_temp:.1f}°C" if thermal.cpu_temp else "   CPU temp:     N/A")
+            self._print(f"   Thermal state: {thermal.cpu_state.value}")
+            self._print(f"   Throttle:     {thermal.throttle_state.value}")
+
+            if thermal.sensors:
+                self._print("\n   Detected sensors:")
+                for sensor in heapq.nlargest(8, thermal.sensors, key=lambda x: x.temperature):
+                    self._print(f"      {sensor.name:8s} ({sensor.location:10s}): {sensor.temperature:.1f}°C")
+
+            # Disk analysis
+            self._print_subheader("💿 Disk Analysis")
+
+            disk = probes['disk']
+            self._print(f"   Total space:  {disk['total_formatted']}")
+            self._print(f"   Used:         {disk['used_formatted']} ({disk['percent_used']:.1f}%)")
+            self._print(f"   Free:         {disk['free_formatted']}")
+
+            analysis = probes['cleanable']
+            total_cleanable = sum(analysis.values())
+
+            self._print(f"\n   Cleanable space by category:")
+            for category, size in sorted(analysis.items(), key=lambda x: x[1], reverse=True):
+                if size > 10 * 1024 * 1024:  # > 10MB
+                    self._print(f"      {category.value:20s}: {self.disk_cleaner.format_size(size)}")
+
+            self._print(f"\n   Total cleanable: {self.disk_cleaner.format_size(total_cleanable)}", Colors.CYAN)
+
+            # Recommendations
+            self._print_subheader("💡 Recommendations")
+
+            recommendations = []
+
+            # CPU recommendations
+            cpu_percent = self._sample_cpu_percent()
+            if cpu_percent > 80:
+                recommendations.append("High CPU usage - consider closing resource-intensive apps")
+            elif cpu_percent > 50:
+                recommendations.append("Moderate CPU usage - monitor for sustained high load")
+
+            # Memory recommendations
+            recommendations.extend(self.memory_monitor.get_recommendations(mem_stats))
+
+            # Thermal recommendations
+            recommendations.extend(thermal.recommendations)
+
+            # Disk recommendations
+            if disk['percent_used'] > 90:
+                recommendations.append(f"Disk nearly full ({disk['percent_used']:.0f}%) - run cleanup immediately")
+            elif disk['percent_used'] > 80:
+                recommendations.append(f"Disk usage high ({disk['percent_used']:.0f}%) - consider running cleanup")
 
-        # CPU recommendations
-        cpu_percent = psutil.cpu_percent()
-        if cpu_percent > 80:
-            recommendations.append("High CPU usage - consider closing resource-intensive apps")
-        elif cpu_percent > 50:
-            recommendations.append("Moderate CPU usage - monitor for sustained high load")
+            if total_cleanable > 1024 ** 3:  # > 1GB
+                recommendations.append(f"Over {self.disk_cleaner.format_size(total_cleanable)} of cleanable data found")
 
-        # Memory recommendations
-        recommendations.extend(self.memory_monitor.get_recommendations(mem_stats))
-
-        # Thermal recommendations
-        recommendations.extend(thermal.recommendations)
-
-        # Disk recommendations
-        if disk['percent_used'] > 90:
-            recommendations.append(f"Disk nearly full ({disk['percent_used']:.0f}%) - run cleanup immediately")
-        elif disk['percent_used'] > 80:
-            recommendations.append(f"Disk usage high ({disk['percent_used']:.0f}%) - consider running cleanup")
-
-        if total_cleanable > 1024 ** 3:  # > 1GB
-            recommendations.append(f"Over {self.disk_cleaner.format_size(total_cleanable)} of cleanable data found")
-
-        if not recommendations:
-            self._print("   ✅ System is running optimally", Colors.GREEN)
-        else:
-            for rec in recommendations:
-                if "critical" in rec.lower() or "danger" in rec.lower():
-                    color = Colors.RED
-                elif "warning" in rec.lower() or "high" in rec.lower():
-                    color = Colors.YELLOW
-                else:
-                    color = Colors.WHITE
-                self._print(f"   • {rec}", color)
+            if not recommendations:
+                self._print("   ✅ System is running optimally", Colors.GREEN)
+            else:
+                for rec in recommendations:
+                    if "critical" in rec.lower() or "danger" in rec.lower():
+                        color = Colors.RED
+                    elif "warning" in rec.lower() or "high" in rec.lower():
+                        color = Colors.YELLOW
+                    else:
+                        color = Colors.WHITE
+                    self._print(f"   • {rec}", color)
 
-        print()
+            self._print("")
 
-    def run_monitor(self, interval: float = 2.0):
+    def run_monitor(self, interval: float = 2.0, backoff: bool = True):
         """
         Run continuous monitoring
 
         Args:
             interval: Update interval in seconds
+            backoff: Poll less often while readings are stable
         """
         self._print_header("CONTINUOUS MONITORING")
         self._print("Press Ctrl+C to stop\n", Colors.DIM)
 
-        # Handle Ctrl+C gracefully
-        def signal_handler(sig, frame):
-            print("\n\nMonitoring stopped.")
-            sys.exit(0)
-
-        signal.signal(signal.SIGINT, signal_handler)
+        sys.stdout.flush()  # Header first; frames are written whole below
 
         iteration = 0
-        while True:
-            iteration += 1
-
-            # Clear previous output (move cursor up)
-            if iteration > 1:
-                print("\033[10A\033[J", end="")  # Move up 10 lines and clear
-
-            # Get metrics
-            cpu = psutil.cpu_percent(interval=0.1)
-            mem = self.memory_monitor.get_stats()
-            thermal = self.thermal_monitor.get_status(include_sensors=False)
-
-            # Build status line
-            cpu_color = self._get_cpu_color(cpu)
-            mem_color = self._get_memory_color(mem.percent_used)
-            thermal_color = self._get_thermal_color(thermal.cpu_state)
-
-            timestamp = time.strftime("%H:%M:%S")
-
-            print(f"[{timestamp}] Update #{iteration}")
-            print("-" * 50)
-            print(f"{cpu_color}CPU:     {cpu:5.1f}%{Colors.RESET}")
-            print(f"{mem_color}Memory:  {mem.percent_used:5.1f}% ({self.memory_monitor.format_bytes(mem.used)}){Colors.RESET}")
-            print(f"         Pressure: {mem.pressure.value}")
-            print(f"{thermal_color}Thermal: {thermal.cpu_temp:.0f}°C ({thermal.cpu_state.value}){Colors.RESET}" if thermal.cpu_temp else f"{thermal_color}Thermal: {thermal.cpu_state.value}{Colors.RESET}")
+        frame_lines = 0  # Height of the frame currently on screen
+        mem = thermal = None
+        # Ticks are scheduled against a deadline so collection time doesn't
+        # stretch the interval; overrun is how late the last tick finished
+        next_tick = time.monotonic()
+        overrun = 0.0
+        stable_ticks = 0
+        prev_reading = None  # (cpu %, memory %, CPU °C) of the previous tick
+        tick_interval = interval  # Delay before the tick being collected
+        mem_read_at = thermal_read_at = 0.0  # time.monotonic() of the cached readings
+        # Ctrl+C ends monitoring with a normal return, so callers and
+        # the interpreter get to clean up instead of a sys.exit() mid-tick
+        try:
+            while True:
+                iteration += 1
+
+                # Get metrics, reusing the previous memory/thermal reading
+                # until it is due. Due-ness is by elapsed time (with half a
+                # base interval of slack for scheduling jitter), and a
+                # backed-off tick is already slow, so it reads everything
+                now = time.monotonic()
+                backed_off = tick_interval > interval
+                cpu = psutil.cpu_percent(interval=0.1)
+                if (mem is None or backed_off
+                        or now - mem_read_at >= (self.MONITOR_MEMORY_EVERY - 0.5) * interval):
+                    mem = self.memory_monitor.get_stats()
+                    mem_read_at = now
+                if (thermal is None or backed_off
+                        or thermal.cpu_state in self.MONITOR_HOT_STATES
+                        or now - thermal_read_at >= (self.MONITOR_THERMAL_EVERY - 0.5) * interval):
+                    thermal = self.thermal_monitor.get_status(include_sensors=False)
+                    thermal_read_at = now
+
+                # Build status line
+                cpu_color = self._get_cpu_color(cpu)
+                mem_color = self._get_memory_color(mem.percent_used)
+                thermal_color = self._get_thermal_color(thermal.cpu_state)
+
+                timestamp = time.strftime("%H:%M:%S")
+
+                # Build the whole frame, then replace the previous one in a
+                # single write so the terminal never shows a half-drawn update
+                lines = [
+                    f"[{timestamp}] Update #{iteration}",
+                    "-" * 50,
+                    f"{cpu_color}CPU:     {cpu:5.1f}%{Colors.RESET}",
+                    f"{mem_color}Memory:  {mem.percent_used:5.1f}% ({self.memory_monitor.format_bytes(mem.used)}){Colors.RESET}",
+                    f"         Pressure: {mem.pressure.value}",
+                    f"{thermal_color}Thermal: {thermal.cpu_temp:.0f}°C ({thermal.cpu_state.value}){Colors.RESET}" if thermal.cpu_temp else f"{thermal_color}Thermal: {thermal.cpu_state.value}{Colors.RESET}",
+                ]
 
-            if thermal.throttle_state != ThrottleState.NONE:
-                print(f"{Colors.RED}⚠️  THROTTLING: {thermal.throttle_state.value}{Colors.RESET}")
-
-            # Alerts
-            alerts = []
-            if cpu > 80:
-                alerts.append("High CPU")
-            if mem.pressure == MemoryPressure.CRITICAL:
-                alerts.append("Critical Memory")
-            if thermal.cpu_state in [ThermalState.CRITICAL, ThermalState.DANGER]:
-                alerts.append("High Temperature")
-
-            if alerts:
-                print(f"\n{Colors.RED}ALERTS: {', '.join(alerts)}{Colors.RESET}")
-            else:
-                print()
+                if thermal.throttle_state != ThrottleState.NONE:
+                    lines.append(f"{Colors.RED}⚠️  THROTTLING: {thermal.throttle_state.value}{Colors.RESET}")
+
+                # Alerts
+                alerts = []
+                if cpu > 80:
+                    alerts.append("High CPU")
+                if mem.pressure == MemoryPressure.CRITICAL:
+                    alerts.append("Critical Memory")
+                if thermal.cpu_state in self.MONITOR_HOT_STATES:
+                    alerts.append("High Temperature")
+
+                if backoff:
+                    reading = (cpu, mem.percent_used, thermal.cpu_temp)
+                    if alerts or prev_reading is None:
+                        stable_ticks = 0
+                    else:
+                        change = sum(abs(now - before) for now, before in zip(reading, prev_reading))
+                        stable_ticks = stable_ticks + 1 if change < self.MONITOR_STABLE_CHANGE else 0
+                    prev_reading = reading
+                tick_interval = interval
+                if stable_ticks:
+                    scaled = interval * 2 ** min(stable_ticks, self.MONITOR_BACKOFF_MAX_STEPS)
+                    tick_interval = max(interval, min(self.MONITOR_BACKOFF_MAX_SECONDS, scaled))
+
+                if overrun > 0:
+                    lines.append(f"{Colors.DIM}Last update ran {overrun:.1f}s past its deadline "
+                                 f"- consider a larger --interval{Colors.RESET}")
+                if tick_interval > interval:
+                    lines.append(f"{Colors.DIM}Readings steady - next update in {tick_interval:g}s{Colors.RESET}")
+
+                lines.append("")
+                if alerts:
+                    lines.append(f"{Colors.RED}ALERTS: {', '.join(alerts)}{Colors.RESET}")
+
+                # Move up over exactly the previous frame and clear below it
+                clear = f"\033[{frame_lines}A\033[J" if frame_lines else ""
+                sys.stdout.write(clear + "\n".join(lines) + "\n")
+                sys.stdout.flush()
+                frame_lines = len(lines)
+
+                next_tick += tick_interval
+                sleep_for = next_tick - time.monotonic()
+                if sleep_for < 0:
+                    # Behind schedule: start the next tick now rather than
+                    # firing a burst of catch-up ticks
+                    overrun = -sleep_for
+                    next_tick = time.monotonic()
+                else:
+                    overrun = 0.0
+                    time.sleep(sleep_for)
 
-            time.sleep(interval)
+        except KeyboardInterrupt:
+            self._print("\n\nMonitoring stopped.", Colors.DIM)
 
 
 def main():
@@ -496,6 +691,7 @@ Examples:
   %(prog)s cleanup --aggressive  Aggressive cleanup
   %(prog)s monitor             Continuous monitoring
   %(prog)s analyze             Full system analysis
+  %(prog)s analyze --with-sensors  Analysis including each thermal sensor
         """
     )
 
@@ -511,12 +707,18 @@ Examples:
                        help='Skip cache cleanup')
     parser.add_argument('--interval', type=float, default=2.0,
                        help='Monitor update interval (default: 2.0)')
+    parser.add_argument('--with-sensors', action='store_true',
+                       help='List individual thermal sensors in analyze')
+    parser.add_argument('--no-backoff', action='store_true',
+                       help='Keep the monitor at --interval even while readings are stable')
+    parser.add_argument('--no-parallel', action='store_true',
+                       help='Run status/analyze probes one at a time (for debugging)')
     parser.add_argument('-v', '--verbose', action='store_true',
                        help='Verbose output')
 
     args = parser.parse_args()
 
-    optimizer = SystemOptimizer(verbose=args.verbose)
+    optimizer = SystemOptimizer(verbose=args.verbose, parallel=not args.no_parallel)
 
     if args.command == 'status':
         optimizer.show_status()
@@ -528,9 +730,9 @@ Examples:
             caches=not args.no_caches
         )
     elif args.command == 'monitor':
-        optimizer.run_monitor(interval=args.interval)
+        optimizer.run_monitor(interval=args.interval, backoff=not args.no_backoff)
     elif args.command == 'analyze':
-        optimizer.run_analyze()
+        optimizer.run_analyze(with_sensors=args.with_sensors)
 
 
 if __name__ == "__main__":